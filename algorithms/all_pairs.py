@@ -0,0 +1,219 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import networkx as nx
+import numpy as np
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+from algorithms.bellman_ford import NegativeCycleError, bellman_ford_arrays
+from algorithms.graph_arrays import CSRGraph
+
+METHODS = ("auto", "floyd_warshall", "johnson")
+
+# Densité (arcs / n²) au-delà de laquelle Floyd-Warshall est préféré à Johnson
+DENSE_THRESHOLD = 0.1
+
+# Tableaux attachés dans chaque processus de calcul (Johnson)
+_worker: Dict[str, object] = {}
+
+
+def all_pairs_distances(G: nx.Graph, weight: str = 'weight', method: str = "auto",
+                        path: Optional[str] = None, block: int = 256,
+                        max_workers: Optional[int] = None) -> Tuple[List[Hashable], np.ndarray]:
+    """
+    Matrice des distances entre tous les couples de sommets (float32, inf si
+    inatteignable), dans l'ordre de G.nodes().
+
+    Si path est donné, la matrice est écrite dans un fichier .npy projeté en
+    mémoire (np.memmap) et n'a pas besoin de tenir en RAM.
+    method : 'floyd_warshall' (graphes denses), 'johnson' (graphes creux) ou
+    'auto' (choix selon la densité du graphe).
+    """
+    if method not in METHODS:
+        raise ValueError(f"Méthode non supportée: {method}")
+    graph = CSRGraph.from_networkx(G, weight=weight)
+    n = graph.num_nodes
+    if method == "auto":
+        method = "floyd_warshall" if len(graph.indices) >= DENSE_THRESHOLD * n * n else "johnson"
+
+    if method == "floyd_warshall":
+        matrix = _output(path, (n, n))
+        floyd_warshall(graph, matrix, block)
+    else:
+        matrix = johnson(graph, range(n), path, max_workers)
+    return graph.nodes, matrix
+
+
+def distance_matrix(G: nx.Graph, origins: Sequence[Hashable], destinations: Sequence[Hashable],
+                    weight: str = 'weight', max_workers: Optional[int] = None) -> np.ndarray:
+    """
+    Distances des origines vers les destinations (une ligne par origine, inf
+    si inatteignable), par exemple comme matrice de coûts d'un problème de
+    transport : seuls les Dijkstra depuis les origines sont calculés.
+    """
+    graph = CSRGraph.from_networkx(G, weight=weight)
+    for node in list(origins) + list(destinations):
+        if node not in graph.index:
+            raise ValueError(f"Le sommet {node} n'est pas dans le graphe")
+    rows = johnson(graph, [graph.index[node] for node in origins], None, max_workers)
+    return np.asarray(rows)[:, [graph.index[node] for node in destinations]].astype(float)
+
+
+def floyd_warshall(graph: CSRGraph, matrix: np.ndarray, block: int = 256) -> np.ndarray:
+    """
+    Floyd-Warshall par blocs de lignes, en place dans matrix (n x n).
+
+    Pour chaque bloc K de sommets intermédiaires, les lignes de K sont d'abord
+    terminées entre elles, puis chaque bloc de lignes I est chargé une fois,
+    mis à jour par D[I, :] = min(D[I, :], D[I, k] + D[k, :]) pour k dans K, et
+    réécrit : la matrice n'est parcourue qu'une fois par bloc, ce qui limite
+    les accès au disque quand elle est projetée en mémoire.
+    """
+    n = graph.num_nodes
+    sources, targets, weights = graph.edges()
+    for start in range(0, n, block):
+        rows = matrix[start:start + block]
+        rows[...] = np.inf
+        local = (sources >= start) & (sources < start + block)
+        np.minimum.at(rows, (sources[local] - start, targets[local]),
+                      weights[local] if weights is not None else 1.0)
+        diagonal = np.arange(start, min(start + block, n))
+        rows[diagonal - start, diagonal] = np.minimum(rows[diagonal - start, diagonal], 0)
+
+    for k0 in range(0, n, block):
+        k1 = min(k0 + block, n)
+        pivot = np.array(matrix[k0:k1])
+        for k in range(k0, k1):
+            np.minimum(pivot, pivot[:, k, None] + pivot[None, k - k0, :], out=pivot)
+        matrix[k0:k1] = pivot
+
+        for i0 in range(0, n, block):
+            if i0 == k0:
+                continue
+            rows = np.array(matrix[i0:i0 + block])
+            for k in range(k0, k1):
+                np.minimum(rows, rows[:, k, None] + pivot[None, k - k0, :], out=rows)
+            matrix[i0:i0 + block] = rows
+
+    if (np.diagonal(matrix) < 0).any():
+        # Bellman-Ford depuis une source virtuelle retrouve le cycle négatif
+        _potentials(graph)
+    if isinstance(matrix, np.memmap):
+        matrix.flush()
+    return matrix
+
+
+def johnson(graph: CSRGraph, sources: Sequence[int], path: Optional[str] = None,
+            max_workers: Optional[int] = None, chunk: int = 64) -> np.ndarray:
+    """
+    Algorithme de Johnson : les poids sont rendus positifs par les potentiels
+    h de Bellman-Ford (w'(u, v) = w(u, v) + h[u] - h[v]), puis un Dijkstra par
+    source est lancé, les sources étant réparties par blocs sur un pool de
+    processus. Chaque processus écrit ses lignes directement dans la matrice
+    résultat (fichier projeté ou mémoire partagée).
+    """
+    n = graph.num_nodes
+    sources = list(sources)
+    weights = graph.weights if graph.weights is not None else np.ones(len(graph.indices))
+    potential = np.zeros(n)
+    if (weights < 0).any():
+        potential = _potentials(graph)
+    edge_sources, targets, _ = graph.edges()
+    # Poids repondérés positifs (au bruit d'arrondi près, ramené à 0)
+    reduced = np.maximum(weights + potential[edge_sources] - potential[targets], 0)
+
+    shape = (len(sources), n)
+    shm = None
+    if path is None:
+        shm = shared_memory.SharedMemory(create=True, size=max(4 * len(sources) * n, 1))
+        output = ('shm', shm.name)
+        matrix = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+    else:
+        matrix = _output(path, shape)
+        matrix.flush()
+        output = ('npy', path)
+
+    try:
+        blocks = [(first, sources[first:first + chunk]) for first in range(0, len(sources), chunk)]
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                                 initializer=_attach,
+                                 initargs=(graph.indptr, graph.indices, reduced, potential,
+                                           output, shape)) as executor:
+            for future in [executor.submit(_dijkstra_rows, first, block) for first, block in blocks]:
+                future.result()
+        if shm is not None:
+            return matrix.copy()
+        return np.load(path, mmap_mode='r+')
+    finally:
+        if shm is not None:
+            del matrix
+            shm.close()
+            shm.unlink()
+
+
+def _potentials(graph: CSRGraph) -> np.ndarray:
+    """
+    Potentiels de Bellman-Ford depuis une source virtuelle. Un cycle négatif
+    lève NegativeCycleError avec les sommets du graphe, comme
+    GraphAlgorithms.bellman_ford.
+    """
+    try:
+        potential, _ = bellman_ford_arrays(graph, None)
+    except NegativeCycleError as error:
+        raise NegativeCycleError([graph.nodes[i] for i in error.cycle]) from None
+    return potential
+
+
+def _output(path: Optional[str], shape: Tuple[int, int]) -> np.ndarray:
+    if path is None:
+        return np.empty(shape, dtype=np.float32)
+    return np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=shape)
+
+
+def _attach(indptr: np.ndarray, indices: np.ndarray, reduced: np.ndarray,
+            potential: np.ndarray, output: Tuple[str, str], shape: Tuple[int, int]) -> None:
+    """
+    Initialisation d'un processus de calcul : graphe repondéré en listes Python
+    et projection de la matrice résultat.
+    """
+    _worker['indptr'] = indptr.tolist()
+    _worker['indices'] = indices.tolist()
+    _worker['weights'] = reduced.tolist()
+    _worker['potential'] = potential
+    kind, name = output
+    if kind == 'shm':
+        shm = shared_memory.SharedMemory(name=name)
+        _worker['segment'] = shm
+        _worker['matrix'] = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+    else:
+        _worker['matrix'] = np.load(name, mmap_mode='r+')
+
+
+def _dijkstra_rows(first: int, sources: List[int]) -> None:
+    """
+    Lignes first.. de la matrice : Dijkstra sur les poids repondérés depuis
+    chaque source, distances ramenées aux poids d'origine.
+    """
+    indptr, indices, weights = _worker['indptr'], _worker['indices'], _worker['weights']
+    potential = _worker['potential']
+    matrix = _worker['matrix']
+    n = len(indptr) - 1
+    inf = float('inf')
+
+    for row, source in enumerate(sources, start=first):
+        dist = [inf] * n
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+        while heap:
+            d, node = heapq.heappop(heap)
+            if d > dist[node]:
+                continue
+            for k in range(indptr[node], indptr[node + 1]):
+                nxt = indices[k]
+                nd = d + weights[k]
+                if nd < dist[nxt]:
+                    dist[nxt] = nd
+                    heapq.heappush(heap, (nd, nxt))
+        matrix[row] = np.array(dist) - potential[source] + potential
+    if isinstance(matrix, np.memmap):
+        matrix.flush()
@@ -0,0 +1,134 @@
+from collections import deque
+import numpy as np
+from typing import Hashable, List, Optional, Tuple
+from algorithms.graph_arrays import CSRGraph
+
+MODES = ("vectorise", "file")
+
+
+class NegativeCycleError(ValueError):
+    """
+    Cycle de poids négatif atteignable depuis la source. cycle est la liste
+    fermée de ses sommets (le premier est répété à la fin).
+    """
+
+    def __init__(self, cycle: List[Hashable]):
+        super().__init__("Le graphe contient un cycle de poids négatif.")
+        self.cycle = cycle
+
+
+def bellman_ford_arrays(graph: CSRGraph, source: Optional[int],
+                        mode: str = "vectorise") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bellman-Ford sur les arcs du graphe en tableaux (source, destination, poids).
+    Renvoie les distances depuis source (inf si inatteignable) et le
+    prédécesseur de chaque sommet (-1 pour la source et les inatteignables).
+
+    mode 'vectorise' : chaque tour relâche tous les arcs d'un coup
+    (np.minimum.at), arrêt dès qu'un tour ne change plus aucune distance.
+    mode 'file' : variante SPFA, seuls les successeurs des sommets améliorés
+    sont relâchés, ce qui convient aux mises à jour peu nombreuses.
+
+    Avec source=None, tous les sommets partent de 0 (source virtuelle reliée à
+    chacun par un arc nul) : on obtient des potentiels pour la repondération de
+    Johnson.
+
+    Lève NegativeCycleError (sommets en indices du graphe) si un cycle négatif
+    est atteignable depuis source.
+    """
+    if mode == "vectorise":
+        return _rounds(graph, source)
+    if mode == "file":
+        return _queue(graph, source)
+    raise ValueError(f"Mode non supporté: {mode}")
+
+
+def _rounds(graph: CSRGraph, source: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+    n = graph.num_nodes
+    sources, targets, weights = graph.edges()
+    if weights is None:
+        weights = np.ones(len(targets))
+    dist = np.zeros(n) if source is None else np.full(n, np.inf)
+    if source is not None:
+        dist[source] = 0.0
+    pred = np.full(n, -1, dtype=np.int64)
+
+    for _ in range(n):
+        candidate = dist[sources] + weights
+        better = candidate < dist[targets]
+        if not better.any():
+            return dist, pred
+        updated = dist.copy()
+        np.minimum.at(updated, targets[better], candidate[better])
+
+        # Prédécesseur : un arc réalisant le nouveau minimum
+        best = better & (candidate == updated[targets])
+        pred[targets[best]] = sources[best]
+        changed = np.flatnonzero(updated < dist)
+        dist = updated
+
+    # Encore des améliorations au n-ième tour : cycle négatif
+    raise NegativeCycleError(_cycle(pred, changed.tolist()))
+
+
+def _queue(graph: CSRGraph, source: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+    n = graph.num_nodes
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    weights = graph.weights.tolist() if graph.weights is not None else [1.0] * len(indices)
+    if source is None:
+        dist = [0.0] * n
+        queue = deque(range(n))
+    else:
+        dist = [np.inf] * n
+        dist[source] = 0.0
+        queue = deque([source])
+    pred = [-1] * n
+    hops = [0] * n  # Nombre d'arcs du chemin courant : n ou plus signale un cycle
+    queued = [False] * n
+    for node in queue:
+        queued[node] = True
+
+    while queue:
+        node = queue.popleft()
+        queued[node] = False
+        d = dist[node]
+        for k in range(indptr[node], indptr[node + 1]):
+            nxt = indices[k]
+            nd = d + weights[k]
+            if nd < dist[nxt]:
+                dist[nxt] = nd
+                pred[nxt] = node
+                hops[nxt] = hops[node] + 1
+                if hops[nxt] >= n:
+                    raise NegativeCycleError(_cycle(pred, [nxt]))
+                if not queued[nxt]:
+                    queued[nxt] = True
+                    queue.append(nxt)
+
+    return np.array(dist), np.array(pred, dtype=np.int64)
+
+
+def _cycle(pred, candidates: List[int]) -> List[int]:
+    """
+    Cycle du graphe des prédécesseurs atteint en remontant depuis l'un des
+    sommets candidats (mis à jour en dernier).
+    """
+    pred = list(pred)
+    n = len(pred)
+    for node in candidates:
+        # n remontées mènent forcément dans le cycle si le chemin ne s'arrête pas
+        for _ in range(n):
+            node = pred[node]
+            if node < 0:
+                break
+        if node < 0:
+            continue
+        cycle = [node]
+        current = pred[node]
+        while current != node:
+            cycle.append(current)
+            current = pred[current]
+        cycle.append(node)
+        return cycle[::-1]
+    raise RuntimeError("Cycle négatif introuvable dans le graphe des prédécesseurs")
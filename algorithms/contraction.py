@@ -0,0 +1,234 @@
+import heapq
+import math
+import networkx as nx
+import numpy as np
+from typing import Dict, Hashable, List, Tuple
+
+# Limite de sommets explorés par une recherche de témoin lors de la contraction
+WITNESS_LIMIT = 60
+
+
+class ContractionHierarchy:
+    """
+    Index de hiérarchie de contraction pour les requêtes point à point sur un
+    graphe pondéré statique.
+
+    Le prétraitement contracte les sommets un à un, du moins important au plus
+    important : un raccourci u -> x de poids w(u, v) + w(v, x) est ajouté quand
+    la contraction de v supprimerait le seul plus court chemin u -> v -> x (pas
+    de chemin témoin plus court trouvé par une recherche locale). Une requête
+    est alors un Dijkstra bidirectionnel qui ne monte que vers des sommets
+    contractés plus tard ; les raccourcis du chemin trouvé sont ensuite
+    dépliés en arêtes d'origine.
+    """
+
+    def __init__(self, nodes: List[Hashable], upward: List[List[Tuple[int, float]]],
+                 downward: List[List[Tuple[int, float]]], middle: Dict[Tuple[int, int], int]):
+        self.nodes = nodes
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.upward = upward      # Arcs v -> x vers un sommet contracté après v
+        self.downward = downward  # Arcs u -> v depuis un sommet u contracté après v, stockés en v
+        self.middle = middle      # Raccourci (u, x) -> sommet contracté v
+
+    @classmethod
+    def build(cls, G: nx.Graph, weight: str = 'weight') -> 'ContractionHierarchy':
+        """
+        Construit l'index. Les sommets sont choisis par différence d'arêtes
+        (raccourcis ajoutés moins arcs supprimés) plus le nombre de voisins déjà
+        contractés, priorité recalculée paresseusement à l'extraction.
+        """
+        nodes = list(G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        n = len(nodes)
+        out: List[Dict[int, float]] = [{} for _ in range(n)]
+        inn: List[Dict[int, float]] = [{} for _ in range(n)]
+        arcs = G.edges(data=weight, default=1)
+        if not G.is_directed():
+            arcs = [(u, v, w) for u, v, w in arcs] + [(v, u, w) for u, v, w in arcs]
+        for u, v, w in arcs:
+            if w < 0:
+                raise ValueError("Les poids doivent être positifs")
+            a, b = index[u], index[v]
+            if a != b and w < out[a].get(b, math.inf):
+                out[a][b] = inn[b][a] = w
+
+        contracted = [False] * n
+        neighbors_done = [0] * n
+        heap = [(cls._priority(v, out, inn, neighbors_done), v) for v in range(n)]
+        heapq.heapify(heap)
+        upward: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        downward: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+        middle: Dict[Tuple[int, int], int] = {}
+
+        while heap:
+            _, v = heapq.heappop(heap)
+            if contracted[v]:
+                continue
+            shortcuts = cls._shortcuts(v, out, inn)
+            priority = len(shortcuts) - len(out[v]) - len(inn[v]) + neighbors_done[v]
+            if heap and priority > heap[0][0]:
+                heapq.heappush(heap, (priority, v))
+                continue
+
+            contracted[v] = True
+            upward[v] = list(out[v].items())
+            downward[v] = list(inn[v].items())
+            for x in out[v]:
+                del inn[x][v]
+                neighbors_done[x] += 1
+            for u in inn[v]:
+                del out[u][v]
+                neighbors_done[u] += 1
+            for u, x, w in shortcuts:
+                out[u][x] = inn[x][u] = w
+                middle[(u, x)] = v
+            out[v], inn[v] = {}, {}
+
+        return cls(nodes, upward, downward, middle)
+
+    @staticmethod
+    def _priority(v: int, out, inn, neighbors_done) -> int:
+        return len(ContractionHierarchy._shortcuts(v, out, inn)) \
+            - len(out[v]) - len(inn[v]) + neighbors_done[v]
+
+    @staticmethod
+    def _shortcuts(v: int, out: List[Dict[int, float]],
+                   inn: List[Dict[int, float]]) -> List[Tuple[int, int, float]]:
+        """
+        Raccourcis nécessaires à la contraction de v : pour chaque prédécesseur
+        u, une recherche locale depuis u (sans passer par v) cherche un témoin
+        au moins aussi court que u -> v -> x.
+        """
+        shortcuts = []
+        for u, wu in inn[v].items():
+            targets = {x: wu + wx for x, wx in out[v].items() if x != u}
+            if not targets:
+                continue
+            bound = max(targets.values())
+            dist = {u: 0}
+            heap = [(0, u)]
+            settled = 0
+            while heap and settled < WITNESS_LIMIT:
+                d, node = heapq.heappop(heap)
+                if d > dist[node]:
+                    continue
+                if d > bound:
+                    break
+                settled += 1
+                for nxt, w in out[node].items():
+                    nd = d + w
+                    if nxt != v and nd < dist.get(nxt, math.inf):
+                        dist[nxt] = nd
+                        heapq.heappush(heap, (nd, nxt))
+            for x, d in targets.items():
+                if dist.get(x, math.inf) > d:
+                    shortcuts.append((u, x, d))
+        return shortcuts
+
+    def query(self, source: Hashable, target: Hashable) -> Tuple[List[Hashable], float]:
+        """
+        Plus court chemin de source à target : (chemin, longueur), comme
+        GraphAlgorithms.dijkstra.
+        """
+        for node in (source, target):
+            if node not in self.index:
+                raise ValueError(f"Le sommet {node} n'est pas dans le graphe")
+        s, t = self.index[source], self.index[target]
+        arcs = (self.upward, self.downward)
+        dist: List[Dict[int, float]] = [{s: 0}, {t: 0}]
+        pred: List[Dict[int, int]] = [{s: -1}, {t: -1}]
+        heaps = [[(0, s)], [(0, t)]]
+        best, meet = (0, s) if s == t else (math.inf, -1)
+
+        while True:
+            active = [side for side in (0, 1) if heaps[side] and heaps[side][0][0] < best]
+            if not active:
+                break
+            for side in active:
+                d, node = heapq.heappop(heaps[side])
+                if d > dist[side][node]:
+                    continue
+                other = dist[1 - side].get(node)
+                if other is not None and d + other < best:
+                    best, meet = d + other, node
+                for nxt, w in arcs[side][node]:
+                    nd = d + w
+                    if nd < dist[side].get(nxt, math.inf):
+                        dist[side][nxt] = nd
+                        pred[side][nxt] = node
+                        heapq.heappush(heaps[side], (nd, nxt))
+
+        if meet < 0:
+            raise ValueError("Aucun chemin n'existe entre les sommets spécifiés")
+
+        # Chemin dans la hiérarchie, puis dépliage des raccourcis
+        forward = [meet]
+        while pred[0][forward[-1]] >= 0:
+            forward.append(pred[0][forward[-1]])
+        backward = [meet]
+        while pred[1][backward[-1]] >= 0:
+            backward.append(pred[1][backward[-1]])
+        hierarchy = forward[::-1] + backward[1:]
+
+        path = [hierarchy[0]]
+        for u, x in zip(hierarchy, hierarchy[1:]):
+            self._unpack(u, x, path)
+        return [self.nodes[i] for i in path], best
+
+    def _unpack(self, u: int, x: int, path: List[int]) -> None:
+        """
+        Ajoute à path les sommets de l'arc u -> x, raccourcis dépliés (u exclu).
+        """
+        stack = [(u, x)]
+        while stack:
+            a, b = stack.pop()
+            v = self.middle.get((a, b))
+            if v is None:
+                path.append(b)
+            else:
+                stack.append((v, b))
+                stack.append((a, v))
+
+    def save(self, path: str) -> None:
+        """
+        Enregistre l'index au format .npz (arcs montants et descendants en CSR,
+        raccourcis). Les sommets doivent être des entiers ou des chaînes.
+        """
+        if all(type(node) is int for node in self.nodes):
+            labels = np.array(self.nodes, dtype=np.int64)
+        elif all(isinstance(node, str) for node in self.nodes):
+            labels = np.array(self.nodes, dtype=str)
+        else:
+            raise ValueError("Seuls les sommets entiers ou chaînes peuvent être enregistrés")
+        shortcuts = np.array([(u, x, v) for (u, x), v in self.middle.items()],
+                             dtype=np.int64).reshape(-1, 3)
+        np.savez_compressed(path, nodes=labels, shortcuts=shortcuts,
+                            **_csr('up', self.upward), **_csr('down', self.downward))
+
+    @classmethod
+    def load(cls, path: str) -> 'ContractionHierarchy':
+        with np.load(path) as data:
+            nodes = data['nodes'].tolist()
+            upward = _lists(data, 'up')
+            downward = _lists(data, 'down')
+            middle = {(u, x): v for u, x, v in data['shortcuts'].tolist()}
+        return cls(nodes, upward, downward, middle)
+
+
+def _csr(prefix: str, lists: List[List[Tuple[int, float]]]) -> Dict[str, np.ndarray]:
+    """
+    Listes d'arcs en CSR. Le type des poids est déduit des valeurs : des poids
+    entiers restent entiers, et load() rend les mêmes longueurs que build().
+    """
+    indptr = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum([len(arcs) for arcs in lists], out=indptr[1:])
+    flat = [arc for arcs in lists for arc in arcs]
+    return {prefix + '_indptr': indptr,
+            prefix + '_indices': np.array([x for x, _ in flat], dtype=np.int64),
+            prefix + '_weights': np.array([w for _, w in flat])}
+
+
+def _lists(data, prefix: str) -> List[List[Tuple[int, float]]]:
+    indptr = data[prefix + '_indptr'].tolist()
+    arcs = list(zip(data[prefix + '_indices'].tolist(), data[prefix + '_weights'].tolist()))
+    return [arcs[indptr[i]:indptr[i + 1]] for i in range(len(indptr) - 1)]
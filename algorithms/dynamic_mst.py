@@ -0,0 +1,181 @@
+import networkx as nx
+from typing import Dict, Hashable, List, Optional, Tuple
+from algorithms.spanning_tree import minimum_spanning_tree
+
+
+class DynamicMST:
+    """
+    Arbre (ou forêt) couvrant de poids minimal maintenu sous modifications du
+    graphe, sans relancer Kruskal à chaque changement.
+
+    Insertion d'arête et baisse de poids : propriété du cycle, l'arête
+    remplace l'arête la plus lourde du chemin de l'arbre entre ses extrémités
+    si elle est plus légère (parcours de l'arbre en O(n)). Hausse de poids ou
+    suppression d'une arête de l'arbre : l'arbre est coupé et l'arête la plus
+    légère qui relie les deux morceaux la remplace (parcours des arêtes du
+    plus petit morceau), ou l'arbre est entièrement reconstruit si rebuild=True.
+    Les modifications passent par cet objet, qui met aussi G à jour.
+    """
+
+    def __init__(self, G: nx.Graph, weight: str = 'weight'):
+        if G.is_directed():
+            raise ValueError("L'arbre couvrant est défini pour un graphe non orienté")
+        self.G = G
+        self.weight = weight
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """
+        Recalcule l'arbre par Kruskal sur tout le graphe.
+        """
+        tree = minimum_spanning_tree(self.G, self.weight)
+        self.tree: Dict[Hashable, Dict[Hashable, float]] = {node: {} for node in self.G}
+        for a, b, w in zip(tree.u.tolist(), tree.v.tolist(), tree.weight.tolist()):
+            u, v = tree.nodes[a], tree.nodes[b]
+            self.tree[u][v] = self.tree[v][u] = w
+        self.total = tree.total
+
+    def result(self) -> Tuple[List[Tuple[Hashable, Hashable, dict]], float]:
+        """
+        Arêtes de l'arbre (u, v, attributs) et poids total, comme GraphAlgorithms.kruskal.
+        """
+        edges = [(u, v, self.G[u][v]) for u in self.tree for v in self.tree[u]
+                 if self._ordered(u, v)]
+        return edges, self.total
+
+    def in_tree(self, u: Hashable, v: Hashable) -> bool:
+        return u in self.tree and v in self.tree[u]
+
+    def add_edge(self, u: Hashable, v: Hashable, weight: float) -> None:
+        """
+        Ajoute l'arête (u, v), ou modifie son poids si elle existe déjà.
+        """
+        if self.G.has_edge(u, v):
+            self.set_weight(u, v, weight)
+            return
+        self.G.add_edge(u, v, **{self.weight: weight})
+        for node in (u, v):
+            self.tree.setdefault(node, {})
+        if u != v:
+            self._offer(u, v, weight)
+
+    def set_weight(self, u: Hashable, v: Hashable, weight: float, rebuild: bool = False) -> None:
+        """
+        Change le poids de l'arête (u, v).
+        """
+        old = self.G[u][v].get(self.weight, 1)
+        self.G[u][v][self.weight] = weight
+        if u == v:
+            return
+        if not self.in_tree(u, v):
+            if weight < old:
+                self._offer(u, v, weight)
+        elif weight <= old:
+            # Une arête de l'arbre qui s'allège y reste
+            self.tree[u][v] = self.tree[v][u] = weight
+            self.total += weight - old
+        elif rebuild:
+            self.rebuild()
+        else:
+            self._cut(u, v)
+            self._reconnect(u, v)
+
+    def remove_edge(self, u: Hashable, v: Hashable, rebuild: bool = False) -> None:
+        """
+        Supprime l'arête (u, v) du graphe.
+        """
+        self.G.remove_edge(u, v)
+        if not self.in_tree(u, v):
+            return
+        if rebuild:
+            self.rebuild()
+        else:
+            self._cut(u, v)
+            self._reconnect(u, v)
+
+    def _offer(self, u: Hashable, v: Hashable, weight: float) -> None:
+        """
+        Propriété du cycle pour une arête hors arbre de poids weight.
+        """
+        path = self._tree_path(u, v)
+        if path is None:
+            # Extrémités dans deux arbres différents : l'arête les relie
+            self._link(u, v, weight)
+            return
+        heaviest = max(zip(path, path[1:]), key=lambda edge: self.tree[edge[0]][edge[1]])
+        if weight < self.tree[heaviest[0]][heaviest[1]]:
+            self._cut(*heaviest)
+            self._link(u, v, weight)
+
+    def _tree_path(self, u: Hashable, v: Hashable) -> Optional[List[Hashable]]:
+        """
+        Chemin de u à v dans l'arbre (parcours en largeur), None s'ils ne sont
+        pas dans le même arbre.
+        """
+        parent = {u: None}
+        frontier = [u]
+        while frontier and v not in parent:
+            following = []
+            for node in frontier:
+                for nxt in self.tree[node]:
+                    if nxt not in parent:
+                        parent[nxt] = node
+                        following.append(nxt)
+            frontier = following
+        if v not in parent:
+            return None
+        path = [v]
+        while parent[path[-1]] is not None:
+            path.append(parent[path[-1]])
+        return path[::-1]
+
+    def _reconnect(self, u: Hashable, v: Hashable) -> None:
+        """
+        Après la coupure de (u, v), relie les deux morceaux par l'arête la plus
+        légère qui les joint, s'il en existe une.
+        """
+        side = {u}
+        stack = [u]
+        while stack:
+            for nxt in self.tree[stack.pop()]:
+                if nxt not in side:
+                    side.add(nxt)
+                    stack.append(nxt)
+
+        # Composante de v dans la forêt : seules les arêtes vers elle conviennent
+        other = {v}
+        stack = [v]
+        while stack:
+            for nxt in self.tree[stack.pop()]:
+                if nxt not in other:
+                    other.add(nxt)
+                    stack.append(nxt)
+
+        small, large = (side, other) if len(side) <= len(other) else (other, side)
+        best = None
+        for a in small:
+            for b, data in self.G[a].items():
+                if b in large:
+                    w = data.get(self.weight, 1)
+                    if best is None or w < best[2]:
+                        best = (a, b, w)
+        if best is not None:
+            self._link(*best)
+
+    def _link(self, u: Hashable, v: Hashable, weight: float) -> None:
+        self.tree[u][v] = self.tree[v][u] = weight
+        self.total += weight
+
+    def _cut(self, u: Hashable, v: Hashable) -> None:
+        self.total -= self.tree[u].pop(v)
+        del self.tree[v][u]
+
+    @staticmethod
+    def _ordered(u: Hashable, v: Hashable) -> bool:
+        """
+        Vrai pour une seule des deux orientations de l'arête (u, v).
+        """
+        try:
+            return u < v
+        except TypeError:
+            return repr(u) < repr(v)
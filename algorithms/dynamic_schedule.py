@@ -0,0 +1,245 @@
+import heapq
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Set
+import numpy as np
+from algorithms.scheduling import Schedule, metra, task_arrays
+
+
+class Changes(NamedTuple):
+    early: Set[Hashable]       # Tâches dont le début ou la fin au plus tôt a changé
+    late: Set[Hashable]        # Tâches dont le début ou la fin au plus tard a changé
+    duration_changed: bool     # Durée du projet modifiée (toutes les dates au plus tard bougent)
+
+
+class DynamicSchedule:
+    """
+    Ordonnancement METRA maintenu sous modifications du projet, sans tout
+    recalculer à chaque changement.
+
+    On garde un rang topologique par tâche, la date de début au plus tôt et la
+    queue (plus long chemin de la fin de la tâche à la fin du projet) : la fin
+    au plus tard vaut durée du projet - queue. Un changement propage les dates
+    au plus tôt vers l'avant, par rang croissant, et les queues vers l'arrière,
+    par rang décroissant, en s'arrêtant aux tâches dont la valeur ne change
+    pas. Un ajout de précédence contraire à l'ordre courant réordonne seulement
+    la zone concernée (Pearce-Kelly). Chaque modification renvoie les tâches
+    dont les dates ont changé.
+    """
+
+    def __init__(self, tasks: Dict[Hashable, Dict]):
+        self.ids, durations, indptr, indices = task_arrays(tasks)
+        result = metra(durations, indptr, indices, self.ids)
+        n = len(self.ids)
+        self.index = {task: i for i, task in enumerate(self.ids)}
+        self.durations: List = durations.tolist()
+        self.preds: List[List[int]] = [indices[indptr[i]:indptr[i + 1]].tolist() for i in range(n)]
+        self.succs: List[List[int]] = [[] for _ in range(n)]
+        for v, preds in enumerate(self.preds):
+            for p in preds:
+                self.succs[p].append(v)
+        self.rank = [0] * n
+        for position, v in enumerate(result.order.tolist()):
+            self.rank[v] = position
+        self.early = result.early_start.tolist()
+        self.tail = (result.duration - result.late_finish).tolist()
+        self.duration = result.duration
+        # Tas (-fin au plus tôt, tâche) : la durée du projet est le maximum ;
+        # les entrées périmées sont écartées à la lecture
+        self._finish = [(-(e + d), v) for v, (e, d) in enumerate(zip(self.early, self.durations))]
+        heapq.heapify(self._finish)
+
+    def early_dates(self) -> Dict[Hashable, float]:
+        """
+        Dates au plus tôt, comme GraphAlgorithms.potentiel_metra.
+        """
+        return dict(zip(self.ids, self.early))
+
+    def dates(self, task: Hashable) -> Dict[str, float]:
+        """
+        Dates et marges d'une tâche.
+        """
+        v = self._task(task)
+        d = self.durations[v]
+        early_finish = self.early[v] + d
+        late_finish = self.duration - self.tail[v]
+        following = min((self.early[s] for s in self.succs[v]), default=self.duration)
+        return {'early_start': self.early[v], 'early_finish': early_finish,
+                'late_start': late_finish - d, 'late_finish': late_finish,
+                'total_slack': late_finish - early_finish, 'free_slack': following - early_finish}
+
+    def schedule(self) -> Schedule:
+        """
+        Ordonnancement complet, recalculé sur les tableaux.
+        """
+        indptr = np.zeros(len(self.ids) + 1, dtype=np.int64)
+        np.cumsum([len(preds) for preds in self.preds], out=indptr[1:])
+        indices = np.fromiter((p for preds in self.preds for p in preds), dtype=np.int64,
+                              count=int(indptr[-1]))
+        return metra(np.array(self.durations), indptr, indices, self.ids)
+
+    def set_duration(self, task: Hashable, duration: float) -> Changes:
+        """
+        Change la durée d'une tâche.
+        """
+        if duration < 0:
+            raise ValueError("Les durées des tâches doivent être positives")
+        v = self._task(task)
+        if duration == self.durations[v]:
+            return Changes(set(), set(), False)
+        self.durations[v] = duration
+        heapq.heappush(self._finish, (-(self.early[v] + duration), v))
+        early = self._forward(self.succs[v])
+        late = self._backward(self.preds[v])
+        early.add(v)
+        late.add(v)
+        return self._changes(early, late)
+
+    def add_precedence(self, pred: Hashable, task: Hashable) -> Changes:
+        """
+        Ajoute la contrainte « pred précède task ».
+        """
+        p, v = self._task(pred), self._task(task)
+        if p in self.preds[v]:
+            return Changes(set(), set(), False)
+        if p == v:
+            raise ValueError("Le graphe des tâches contient des cycles")
+        if self.rank[p] > self.rank[v]:
+            self._reorder(p, v)
+        self.preds[v].append(p)
+        self.succs[p].append(v)
+        return self._changes(self._forward([v]), self._backward([p]))
+
+    def remove_precedence(self, pred: Hashable, task: Hashable) -> Changes:
+        """
+        Supprime la contrainte « pred précède task ».
+        """
+        p, v = self._task(pred), self._task(task)
+        if p not in self.preds[v]:
+            raise ValueError(f"La tâche {pred} ne précède pas la tâche {task}")
+        self.preds[v] = [q for q in self.preds[v] if q != p]
+        self.succs[p] = [s for s in self.succs[p] if s != v]
+        return self._changes(self._forward([v]), self._backward([p]))
+
+    def add_task(self, task: Hashable, duration: float,
+                 predecessors: Iterable[Hashable] = ()) -> Changes:
+        """
+        Ajoute une tâche, sans successeur, après ses prédécesseurs.
+        """
+        if task in self.index:
+            raise ValueError(f"La tâche {task} existe déjà")
+        if duration < 0:
+            raise ValueError("Les durées des tâches doivent être positives")
+        preds = list(dict.fromkeys(self._task(pred) for pred in predecessors))
+        v = len(self.ids)
+        self.ids.append(task)
+        self.index[task] = v
+        self.durations.append(duration)
+        self.preds.append(preds)
+        self.succs.append([])
+        for p in preds:
+            self.succs[p].append(v)
+        self.rank.append(v)
+        self.early.append(0)
+        self.tail.append(0)
+        heapq.heappush(self._finish, (-duration, v))
+        early = self._forward([v])
+        early.add(v)
+        late = self._backward(preds)
+        late.add(v)
+        return self._changes(early, late)
+
+    def _task(self, task: Hashable) -> int:
+        if task not in self.index:
+            raise ValueError(f"La tâche {task} n'existe pas")
+        return self.index[task]
+
+    def _forward(self, seeds: Iterable[int]) -> Set[int]:
+        """
+        Recalcule les débuts au plus tôt à partir des tâches seeds, par rang
+        croissant : chaque tâche est traitée après tous ses prédécesseurs
+        touchés. Renvoie les tâches dont le début a changé.
+        """
+        heap = [(self.rank[v], v) for v in set(seeds)]
+        heapq.heapify(heap)
+        queued = {v for _, v in heap}
+        changed = set()
+        early, durations = self.early, self.durations
+        while heap:
+            _, v = heapq.heappop(heap)
+            start = max((early[p] + durations[p] for p in self.preds[v]), default=0)
+            if start == early[v]:
+                continue
+            early[v] = start
+            changed.add(v)
+            heapq.heappush(self._finish, (-(start + durations[v]), v))
+            for s in self.succs[v]:
+                if s not in queued:
+                    queued.add(s)
+                    heapq.heappush(heap, (self.rank[s], s))
+        return changed
+
+    def _backward(self, seeds: Iterable[int]) -> Set[int]:
+        """
+        Recalcule les queues à partir des tâches seeds, par rang décroissant.
+        Renvoie les tâches dont la queue a changé.
+        """
+        heap = [(-self.rank[v], v) for v in set(seeds)]
+        heapq.heapify(heap)
+        queued = {v for _, v in heap}
+        changed = set()
+        tail, durations = self.tail, self.durations
+        while heap:
+            _, v = heapq.heappop(heap)
+            length = max((durations[s] + tail[s] for s in self.succs[v]), default=0)
+            if length == tail[v]:
+                continue
+            tail[v] = length
+            changed.add(v)
+            for p in self.preds[v]:
+                if p not in queued:
+                    queued.add(p)
+                    heapq.heappush(heap, (-self.rank[p], p))
+        return changed
+
+    def _changes(self, early: Set[int], late: Set[int]) -> Changes:
+        """
+        Met à jour la durée du projet et traduit les indices en tâches.
+        """
+        finish = self._finish
+        while finish and -finish[0][0] != self.early[finish[0][1]] + self.durations[finish[0][1]]:
+            heapq.heappop(finish)
+        if len(finish) > 2 * len(self.ids):
+            # Trop d'entrées périmées : on reconstruit le tas
+            finish[:] = [(-(e + d), v) for v, (e, d) in enumerate(zip(self.early, self.durations))]
+            heapq.heapify(finish)
+        duration = -finish[0][0] if finish else 0
+        duration_changed = duration != self.duration
+        self.duration = duration
+        if duration_changed:
+            return Changes({self.ids[v] for v in early}, set(self.ids), True)
+        return Changes({self.ids[v] for v in early}, {self.ids[v] for v in late}, False)
+
+    def _reorder(self, p: int, v: int) -> None:
+        """
+        Pearce-Kelly : l'arc p -> v contredit l'ordre (rang de p > rang de v).
+        Les tâches atteignables depuis v de rang au plus celui de p, et celles
+        qui atteignent p de rang au moins celui de v, sont renumérotées sur
+        leurs propres rangs : les secondes avant les premières.
+        """
+        low, high = self.rank[v], self.rank[p]
+        after, stack = {v}, [v]
+        while stack:
+            for s in self.succs[stack.pop()]:
+                if s == p:
+                    raise ValueError("Le graphe des tâches contient des cycles")
+                if s not in after and self.rank[s] < high:
+                    after.add(s)
+                    stack.append(s)
+        before, stack = {p}, [p]
+        while stack:
+            for q in self.preds[stack.pop()]:
+                if q not in before and self.rank[q] > low:
+                    before.add(q)
+                    stack.append(q)
+        moved = sorted(before, key=self.rank.__getitem__) + sorted(after, key=self.rank.__getitem__)
+        for task, position in zip(moved, sorted(self.rank[task] for task in moved)):
+            self.rank[task] = position
@@ -0,0 +1,167 @@
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+import networkx as nx
+import numpy as np
+from typing import Dict, Hashable, List, Optional, Tuple
+from algorithms.max_flow import ResidualGraph, maximum_flow
+
+# Graphe résiduel initial dans chaque processus de calcul
+_worker: Dict[str, object] = {}
+
+
+class GomoryHuTree:
+    """
+    Arbre de Gomory-Hu d'un graphe non orienté à capacités : la coupe minimale
+    entre deux sommets quelconques vaut la plus petite capacité du chemin qui
+    les relie dans l'arbre.
+
+    Construction de Gusfield : n - 1 calculs de flot maximum, chacun entre un
+    sommet s et son parent courant dans l'arbre. Les requêtes utilisent des
+    tables de remontée (binary lifting) : minimum sur le chemin en O(log n).
+    """
+
+    def __init__(self, nodes: List[Hashable], parent: np.ndarray, weight: np.ndarray):
+        self.nodes = nodes
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.parent = parent  # parent[0] == -1 : le sommet 0 est la racine
+        self.weight = weight  # Capacité de l'arête (i, parent[i])
+        self._lift()
+
+    @classmethod
+    def build(cls, G: nx.Graph, capacity: str = 'capacity', algorithm: str = "dinic",
+              max_workers: Optional[int] = None) -> 'GomoryHuTree':
+        """
+        Construit l'arbre. Avec plusieurs processus, les coupes de plusieurs
+        sommets consécutifs sont calculées en même temps avec les parents
+        connus au lancement ; une coupe dont le parent a changé entre-temps
+        (à cause d'une coupe précédente du même lot) est recalculée.
+        """
+        if G.is_directed():
+            raise ValueError("L'arbre de Gomory-Hu est défini pour un graphe non orienté")
+        residual = ResidualGraph(G, capacity)
+        n = residual.num_nodes
+        parent = np.zeros(n, dtype=np.int64)
+        weight = np.zeros(n, dtype=residual.initial.dtype)
+        if n:
+            parent[0] = -1
+        max_workers = max_workers or os.cpu_count() or 1
+
+        if max_workers == 1 or n <= 2:
+            _attach(residual, algorithm)
+            for s in range(1, n):
+                t = int(parent[s])
+                cls._update(parent, weight, s, t, *_cut(s, t))
+            return cls(residual.nodes, parent, weight)
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach,
+                                 initargs=(residual, algorithm)) as executor:
+            s = 1
+            while s < n:
+                batch = range(s, min(s + 2 * max_workers, n))
+                sinks = {v: int(parent[v]) for v in batch}
+                futures = {v: executor.submit(_cut, v, sinks[v]) for v in batch}
+                for v in batch:
+                    value, side = futures[v].result()
+                    t = int(parent[v])
+                    if t != sinks[v]:
+                        # Spéculation invalidée : recalcul avec le bon parent
+                        value, side = executor.submit(_cut, v, t).result()
+                    cls._update(parent, weight, v, t, value, side)
+                s = batch.stop
+        return cls(residual.nodes, parent, weight)
+
+    @staticmethod
+    def _update(parent: np.ndarray, weight: np.ndarray, s: int, t: int,
+                value, side: np.ndarray) -> None:
+        """
+        Étape de Gusfield après la coupe (s, t) de valeur value, side étant le
+        côté de s.
+        """
+        weight[s] = value
+        others = np.arange(len(parent)) != s
+        parent[others & side & (parent == t)] = s
+        if parent[t] >= 0 and side[parent[t]]:
+            parent[s] = parent[t]
+            parent[t] = s
+            weight[s], weight[t] = weight[t], value
+
+    def _lift(self) -> None:
+        """
+        Profondeurs et tables de remontée : up[k][v] est l'ancêtre de v à 2^k
+        niveaux, low[k][v] la plus petite capacité sur ce trajet.
+        """
+        n = len(self.parent)
+        self.depth = np.zeros(n, dtype=np.int64)
+        children: List[List[int]] = [[] for _ in range(n)]
+        roots = []
+        for v, p in enumerate(self.parent.tolist()):
+            (children[p] if p >= 0 else roots).append(v)
+        stack = roots
+        while stack:
+            v = stack.pop()
+            for c in children[v]:
+                self.depth[c] = self.depth[v] + 1
+                stack.append(c)
+
+        up = np.where(self.parent >= 0, self.parent, np.arange(n))
+        low = np.where(self.parent >= 0, self.weight.astype(float), np.inf)
+        self._up, self._low = [up], [low]
+        for _ in range(max(1, int(self.depth.max()).bit_length()) if n else 0):
+            up, low = self._up[-1], self._low[-1]
+            self._up.append(up[up])
+            self._low.append(np.minimum(low, low[up]))
+
+    def min_cut_value(self, u: Hashable, v: Hashable) -> float:
+        """
+        Valeur de la coupe minimale entre u et v.
+        """
+        for node in (u, v):
+            if node not in self.index:
+                raise ValueError(f"Le sommet {node} n'est pas dans le graphe")
+        a, b = self.index[u], self.index[v]
+        if a == b:
+            raise ValueError("La source et le puits doivent être distincts")
+        depth, best = self.depth, np.inf
+        if depth[a] < depth[b]:
+            a, b = b, a
+        diff, k = int(depth[a] - depth[b]), 0
+        while diff:
+            if diff & 1:
+                best = min(best, self._low[k][a])
+                a = int(self._up[k][a])
+            diff >>= 1
+            k += 1
+        if a != b:
+            for k in range(len(self._up) - 1, -1, -1):
+                if self._up[k][a] != self._up[k][b]:
+                    best = min(best, self._low[k][a], self._low[k][b])
+                    a, b = int(self._up[k][a]), int(self._up[k][b])
+            best = min(best, self._low[0][a], self._low[0][b])
+        value = float(best)
+        return int(value) if value.is_integer() and self.weight.dtype.kind in 'iu' else value
+
+    def edges(self) -> List[Tuple[Hashable, Hashable, float]]:
+        """
+        Arêtes de l'arbre (sommet, parent, capacité).
+        """
+        return [(self.nodes[v], self.nodes[p], w)
+                for v, (p, w) in enumerate(zip(self.parent.tolist(), self.weight.tolist())) if p >= 0]
+
+
+def _attach(residual: ResidualGraph, algorithm: str) -> None:
+    _worker['residual'] = residual
+    _worker['algorithm'] = algorithm
+
+
+def _cut(s: int, t: int) -> Tuple[float, np.ndarray]:
+    """
+    Flot maximum de s à t sur une copie des capacités initiales : valeur et
+    côté de s de la coupe minimale.
+    """
+    residual = copy.copy(_worker['residual'])
+    residual.cap = residual.cap.copy()
+    residual.cap[0::2] = residual.initial
+    residual.cap[1::2] = 0
+    value = maximum_flow(residual, s, t, _worker['algorithm'])
+    return value, residual.source_side(s)
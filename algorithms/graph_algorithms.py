@@ -1,114 +1,183 @@
 import networkx as nx
 import random
-from typing import Dict, List, Tuple, Set
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Set
+from algorithms.all_pairs import all_pairs_distances
+from algorithms.bellman_ford import NegativeCycleError, bellman_ford_arrays
+from algorithms.graph_arrays import CSRGraph
+from algorithms.gomory_hu import GomoryHuTree
+from algorithms.graph_coloring import dsatur_coloring, welsh_powell_coloring
+from algorithms.max_flow import FlowResult, ResidualGraph, maximum_flow
+from algorithms.parallel_coloring import parallel_coloring
+from algorithms.pert_simulation import PertSimulation, SimulationResult
+from algorithms.resource_scheduling import resource_schedule
+from algorithms.scheduling import schedule
+from algorithms import shortest_paths
+from algorithms.shortest_paths import Heuristic
+from algorithms.spanning_tree import minimum_spanning_tree
 from config.settings import GRAPH_SETTINGS
 
 class GraphAlgorithms:
     @staticmethod
-    def welsh_powell(G: nx.Graph) -> Dict[int, int]:
+    def welsh_powell(G: nx.Graph) -> Tuple[Dict[int, int], int]:
         """
-        Implémentation corrigée de l'algorithme de Welsh-Powell pour la coloration de graphe.
+        Algorithme de Welsh-Powell pour la coloration de graphe, exécuté sur la
+        représentation CSR du graphe.
         """
-        # Trier les nœuds par degré décroissant
-        nodes = sorted(G.nodes(), key=lambda x: G.degree(x), reverse=True)
-        colors = {}
-        max_color = 0
+        graph = CSRGraph.from_networkx(G)
+        return GraphAlgorithms._coloring_result(graph, welsh_powell_coloring(graph))
 
-        for node in nodes:
-            # Obtenir les couleurs utilisées par les voisins
-            neighbor_colors = {colors.get(neighbor) for neighbor in G.neighbors(node) 
-                             if neighbor in colors}
-            
-            # Trouver la première couleur disponible
-            color = 0
-            while color in neighbor_colors:
-                color += 1
-            
-            colors[node] = color
-            max_color = max(max_color, color)
+    @staticmethod
+    def dsatur(G: nx.Graph) -> Tuple[Dict[int, int], int]:
+        """
+        Coloration DSATUR : utilise en général moins de couleurs que Welsh-Powell.
+        """
+        graph = CSRGraph.from_networkx(G)
+        return GraphAlgorithms._coloring_result(graph, dsatur_coloring(graph))
 
-        return colors, max_color + 1
+    @staticmethod
+    def welsh_powell_parallel(G: nx.Graph, max_workers: Optional[int] = None) -> Tuple[Dict[int, int], int]:
+        """
+        Coloration spéculative répartie sur max_workers processus, pour les très
+        grands graphes. Le nombre de couleurs peut différer légèrement de celui
+        de Welsh-Powell.
+        """
+        graph = CSRGraph.from_networkx(G)
+        return GraphAlgorithms._coloring_result(graph, parallel_coloring(graph, max_workers))
 
     @staticmethod
-    def dijkstra(G: nx.Graph, start: str, end: str) -> Tuple[List[str], float]:
+    def _coloring_result(graph: CSRGraph, colors) -> Tuple[Dict[int, int], int]:
         """
-        Implémentation corrigée de l'algorithme de Dijkstra.
+        Couleurs par sommet et nombre de couleurs utilisées.
+        """
+        num_colors = int(colors.max()) + 1 if len(colors) else 0
+        return dict(zip(graph.nodes, colors.tolist())), num_colors
+
+    @staticmethod
+    def dijkstra(G: nx.Graph, start: str, end: str, method: str = "dijkstra",
+                 heuristic: Optional[Heuristic] = None) -> Tuple[List[str], float]:
+        """
+        Plus court chemin entre start et end, chemin et longueur étant obtenus
+        par une seule recherche.
+        method : 'dijkstra', 'bidirectionnel' ou 'astar' (heuristic : fonction
+        h(sommet, cible) ou coordonnées des sommets).
         """
         try:
-            path = nx.dijkstra_path(G, start, end, weight='weight')
-            path_length = nx.dijkstra_path_length(G, start, end, weight='weight')
-            return path, path_length
+            if method == "dijkstra":
+                result = shortest_paths.dijkstra(G, start, end)
+            elif method == "bidirectionnel":
+                result = shortest_paths.bidirectional_dijkstra(G, start, end)
+            elif method == "astar":
+                result = shortest_paths.astar(G, start, end, heuristic)
+            else:
+                raise ValueError(f"Méthode non supportée: {method}")
+            return result.path, result.length
         except nx.NetworkXNoPath:
             raise ValueError("Aucun chemin n'existe entre les sommets spécifiés")
 
     @staticmethod
-    def kruskal(G: nx.Graph) -> Tuple[List[Tuple[int, int]], float]:
+    def all_pairs_shortest_paths(G: nx.Graph, method: str = "auto",
+                                 path: Optional[str] = None) -> Tuple[List, np.ndarray]:
         """
-        Implémentation corrigée de l'algorithme de Kruskal.
+        Distances entre tous les couples de sommets : (sommets, matrice float32).
+        Voir algorithms.all_pairs.all_pairs_distances.
         """
-        mst = nx.minimum_spanning_tree(G, algorithm='kruskal')
-        mst_edges = list(mst.edges(data=True))
-        total_weight = sum(data['weight'] for _, _, data in mst_edges)
-        return mst_edges, total_weight
+        return all_pairs_distances(G, method=method, path=path)
 
     @staticmethod
-    def ford_fulkerson(G: nx.DiGraph, source: int, sink: int) -> Tuple[float, Dict]:
+    def kruskal(G: nx.Graph, method: str = "kruskal") -> Tuple[List[Tuple[int, int]], float]:
         """
-        Implémentation corrigée de l'algorithme de Ford-Fulkerson.
+        Arbre couvrant de poids minimal sur les arêtes du graphe en tableaux
+        (method : 'kruskal' ou 'boruvka'). Renvoie les arêtes (u, v, attributs)
+        et le poids total.
         """
-        try:
-            flow_value, flow_dict = nx.maximum_flow(G, source, sink)
-            cut_value, partition = nx.minimum_cut(G, source, sink)
-            return flow_value, flow_dict, cut_value, partition
-        except nx.NetworkXError:
-            raise ValueError("Le graphe doit être dirigé avec des capacités valides")
-        
+        tree = minimum_spanning_tree(G, method=method)
+        nodes = tree.nodes
+        mst_edges = [(nodes[a], nodes[b], G[nodes[a]][nodes[b]])
+                     for a, b in zip(tree.u.tolist(), tree.v.tolist())]
+        return mst_edges, tree.total
+
     @staticmethod
-    def bellman_ford(G: nx.DiGraph, start: str, end: str) -> Tuple[list, float]:
+    def ford_fulkerson(G: nx.DiGraph, source: int, sink: int,
+                       algorithm: str = "dinic") -> Tuple[float, Dict]:
         """
-        Implémentation de l'algorithme de Bellman-Ford pour trouver le plus court chemin.
+        Flot maximum et coupe minimale en un seul calcul : la coupe est lue dans
+        le graphe résiduel du flot. algorithm : 'dinic', 'push_relabel' ou
+        'boykov_kolmogorov'. Le flot est renvoyé sous forme de FlowResult
+        (flot par arc en tableau, accès result[u][v] comme un flow_dict).
         """
-        try:
-            length, path = nx.single_source_bellman_ford(G, source=start, target=end)
-            return path, length
-        except nx.NetworkXUnbounded:
-            raise ValueError("Le graphe contient un cycle de poids négatif.")
-        except nx.NetworkXError:
+        if source not in G or sink not in G:
+            raise ValueError("La source et le puits doivent être des sommets du graphe")
+        residual = ResidualGraph(G)
+        flow_value = maximum_flow(residual, residual.index[source], residual.index[sink], algorithm)
+        result = FlowResult(residual, residual.index[source], flow_value)
+        return flow_value, result, result.cut_value, result.partition
+
+    @staticmethod
+    def gomory_hu(G: nx.Graph, algorithm: str = "dinic",
+                  max_workers: Optional[int] = None) -> GomoryHuTree:
+        """
+        Arbre de Gomory-Hu d'un graphe non orienté : tree.min_cut_value(u, v)
+        donne la coupe minimale entre deux sommets sans nouveau calcul de flot.
+        """
+        return GomoryHuTree.build(G, algorithm=algorithm, max_workers=max_workers)
+
+    @staticmethod
+    def bellman_ford(G: nx.DiGraph, start: str, end: str,
+                     mode: str = "vectorise") -> Tuple[list, float]:
+        """
+        Implémentation de l'algorithme de Bellman-Ford pour trouver le plus court chemin,
+        sur les arcs du graphe en tableaux NumPy (mode 'vectorise' ou 'file').
+        Lève NegativeCycleError, qui porte le cycle trouvé, si un cycle de poids
+        négatif est atteignable depuis start.
+        """
+        if start not in G or end not in G:
             raise ValueError("Erreur dans les données du graphe. Vérifiez les sommets et les arêtes.")
+        graph = CSRGraph.from_networkx(G, weight='weight')
+        try:
+            dist, pred = bellman_ford_arrays(graph, graph.index[start], mode)
+        except NegativeCycleError as error:
+            raise NegativeCycleError([graph.nodes[i] for i in error.cycle]) from None
 
+        target = graph.index[end]
+        if np.isinf(dist[target]):
+            raise ValueError("Aucun chemin n'existe entre les sommets spécifiés")
+        path = [target]
+        while path[-1] != graph.index[start]:
+            path.append(int(pred[path[-1]]))
+        length = dist[target]
+        return [graph.nodes[i] for i in reversed(path)], int(length) if length.is_integer() else float(length)
 
     @staticmethod
     def potentiel_metra(tasks: Dict[int, Dict]) -> Tuple[Dict[int, int], int]:
         """
-        Implémentation corrigée de la méthode METRA (calcul des dates au plus tôt).
-        """
-        G = nx.DiGraph()
-        
-        # Créer le graphe
-        for task_id, task_info in tasks.items():
-            G.add_node(task_id, duration=task_info['duration'])
-            for pred in task_info['predecessors']:
-                G.add_edge(pred, task_id)
-
-        # Vérifier s'il y a des cycles
-        if not nx.is_directed_acyclic_graph(G):
-            raise ValueError("Le graphe des tâches contient des cycles")
-
-        # Calculer les dates au plus tôt
-        early_dates = {0: 0}
-        for task in nx.topological_sort(G):
-            if task not in early_dates:
-                early_dates[task] = 0
-            task_duration = tasks[task]['duration']
-            for pred in tasks[task]['predecessors']:
-                early_dates[task] = max(early_dates[task],
-                                      early_dates[pred] + tasks[pred]['duration'])
-
-        # Calculer la durée totale du projet
-        project_duration = max(early_dates[task] + tasks[task]['duration'] 
-                             for task in tasks)
-
-        return early_dates, project_duration
+        Méthode METRA (calcul des dates au plus tôt), sur les tableaux de tâches
+        du module scheduling.
+        """
+        result = schedule(tasks)
+        early_dates = dict(zip(result.tasks, result.early_start.tolist()))
+        return early_dates, result.duration
+
+    @staticmethod
+    def potentiel_metra_simulation(tasks: Dict[int, Dict], scenarios: int = 10000,
+                                   distribution: str = "pert", seed: Optional[int] = None,
+                                   max_workers: int = 1) -> SimulationResult:
+        """
+        Méthode METRA à durées incertaines : simulation de Monte-Carlo de la
+        durée du projet (percentiles) et indices de criticité des tâches.
+        """
+        return PertSimulation(tasks, distribution).run(scenarios, seed=seed,
+                                                       max_workers=max_workers)
+
+    @staticmethod
+    def potentiel_metra_ressources(tasks: Dict[int, Dict], capacities: Dict[str, int],
+                                   rule: str = "fin_tardive") -> Tuple[Dict[int, int], int]:
+        """
+        Méthode METRA sous contraintes de ressources (génération série) : dates
+        de début retenues et durée totale du projet.
+        """
+        result = resource_schedule(tasks, capacities, rule)
+        return dict(zip(result.tasks, result.start.tolist())), result.duration
 
     @staticmethod
     def generate_random_graph(num_vertices: int, algorithm_type: str) -> nx.Graph:
@@ -0,0 +1,76 @@
+from itertools import chain
+import networkx as nx
+import numpy as np
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+class CSRGraph:
+    """
+    Représentation compacte d'un graphe networkx en tableaux NumPy (format CSR) :
+    les voisins (successeurs pour un graphe orienté) du sommet i sont
+    indices[indptr[i]:indptr[i + 1]], avec les poids correspondants dans weights.
+    Les sommets sont numérotés dans l'ordre de G.nodes().
+    """
+
+    def __init__(self, nodes: List[Hashable], indptr: np.ndarray, indices: np.ndarray,
+                 weights: Optional[np.ndarray] = None, directed: bool = False):
+        self.nodes = nodes
+        self.index: Dict[Hashable, int] = {node: i for i, node in enumerate(nodes)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.directed = directed
+
+    @classmethod
+    def from_networkx(cls, G: nx.Graph, weight: Optional[str] = None,
+                      default: float = 1.0) -> 'CSRGraph':
+        """
+        Construit la représentation CSR de G. Si weight est donné, les poids des
+        arêtes sont lus dans cet attribut (default s'il est absent).
+        """
+        nodes = list(G.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        adjacency = G.adj
+        n = len(nodes)
+
+        degrees = np.fromiter((len(neighbors) for neighbors in adjacency.values()),
+                              dtype=np.int64, count=n)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degrees, out=indptr[1:])
+        targets = chain.from_iterable(adjacency.values())
+        if not all(type(node) is int and node == i for i, node in enumerate(nodes)):
+            targets = map(index.__getitem__, targets)
+        indices = np.fromiter(targets, dtype=np.int64, count=int(indptr[-1]))
+        weights = None
+        if weight is not None:
+            weights = np.fromiter((data.get(weight, default)
+                                   for neighbors in adjacency.values()
+                                   for data in neighbors.values()),
+                                  dtype=float, count=int(indptr[-1]))
+
+        graph = cls(nodes, indptr, indices, weights, G.is_directed())
+        graph.index = index
+        return graph
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    def degree(self) -> np.ndarray:
+        """
+        Degré de chaque sommet, les boucles comptant deux fois comme dans networkx
+        (degré sortant pour un graphe orienté).
+        """
+        degree = np.diff(self.indptr)
+        if not self.directed:
+            rows = np.repeat(np.arange(self.num_nodes), degree)
+            degree = degree + np.bincount(rows[self.indices == rows], minlength=self.num_nodes)
+        return degree
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """
+        Arcs (source, destination, poids) en tableaux alignés. Pour un graphe non
+        orienté, chaque arête apparaît dans les deux sens.
+        """
+        sources = np.repeat(np.arange(self.num_nodes), np.diff(self.indptr))
+        return sources, self.indices, self.weights
@@ -0,0 +1,105 @@
+import heapq
+import numpy as np
+from algorithms.graph_arrays import CSRGraph
+
+
+def degree_order(graph: CSRGraph) -> np.ndarray:
+    """
+    Sommets par degré décroissant, à égalité dans l'ordre de G.nodes() : tri par
+    dénombrement (un seau par degré) en O(n + degré maximal).
+    """
+    degree = graph.degree()
+    if not len(degree):
+        return np.zeros(0, dtype=np.int64)
+    keys = degree.max() - degree
+    # Position de départ de chaque seau, puis placement stable sommet par sommet
+    start = np.zeros(int(keys.max()) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys)[:-1], out=start[1:])
+    start = start.tolist()
+    order = [0] * len(keys)
+    for node, key in enumerate(keys.tolist()):
+        order[start[key]] = node
+        start[key] += 1
+    return np.array(order, dtype=np.int64)
+
+
+def welsh_powell_coloring(graph: CSRGraph) -> np.ndarray:
+    """
+    Coloration de Welsh-Powell sur les tableaux CSR : chaque sommet, pris par
+    degré décroissant, reçoit la plus petite couleur absente de ses voisins.
+    Les couleurs interdites sont marquées dans un tableau d'estampilles
+    réutilisé d'un sommet à l'autre (stamp[c] == sommet courant).
+    """
+    n = graph.num_nodes
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    colors = [-1] * n
+    stamp = [-1] * (n + 1)
+
+    for node in degree_order(graph).tolist():
+        for neighbor in indices[indptr[node]:indptr[node + 1]]:
+            color = colors[neighbor]
+            if color >= 0:
+                stamp[color] = node
+        color = 0
+        while stamp[color] == node:
+            color += 1
+        colors[node] = color
+    return np.array(colors, dtype=np.int64)
+
+
+def dsatur_coloring(graph: CSRGraph) -> np.ndarray:
+    """
+    Coloration DSATUR : on colore à chaque étape le sommet dont les voisins
+    portent le plus de couleurs distinctes (saturation), à égalité celui de plus
+    fort degré. Les sommets non colorés sont rangés dans une file à seaux (un
+    tas par niveau de saturation) ; les entrées périmées sont ignorées au
+    moment de leur extraction.
+    """
+    n = graph.num_nodes
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    order = degree_order(graph).tolist()
+    rank = [0] * n
+    for position, node in enumerate(order):
+        rank[node] = position
+
+    colors = [-1] * n
+    saturation = [0] * n
+    neighbor_colors = [set() for _ in range(n)]
+    buckets = [list(range(n))]  # Rangs croissants : le seau 0 est déjà un tas
+    top = 0
+
+    for _ in range(n):
+        # Sommet de saturation maximale, entrées périmées ignorées
+        while True:
+            bucket = buckets[top]
+            while bucket:
+                node = order[bucket[0]]
+                if colors[node] < 0 and saturation[node] == top:
+                    break
+                heapq.heappop(bucket)
+            if bucket:
+                break
+            top -= 1
+        node = order[heapq.heappop(bucket)]
+
+        forbidden = neighbor_colors[node]
+        color = 0
+        while color in forbidden:
+            color += 1
+        colors[node] = color
+        neighbor_colors[node] = None
+
+        for neighbor in indices[indptr[node]:indptr[node + 1]]:
+            seen = neighbor_colors[neighbor]
+            if seen is None or color in seen:
+                continue
+            seen.add(color)
+            level = saturation[neighbor] = saturation[neighbor] + 1
+            if level == len(buckets):
+                buckets.append([])
+            heapq.heappush(buckets[level], rank[neighbor])
+            if level > top:
+                top = level
+    return np.array(colors, dtype=np.int64)
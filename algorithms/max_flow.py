@@ -0,0 +1,507 @@
+from collections import deque
+import networkx as nx
+import numpy as np
+from typing import Dict, Hashable, Iterator, List, Set, Tuple
+
+ALGORITHMS = ("dinic", "push_relabel", "boykov_kolmogorov")
+
+
+class ResidualGraph:
+    """
+    Graphe résiduel en tableaux : l'arc e du graphe (dans l'ordre de G.edges())
+    donne l'arc résiduel 2e (capacité restante) et son opposé 2e + 1 (flot
+    annulable). Les arcs résiduels sortant du sommet u sont
+    arcs[indptr[u]:indptr[u + 1]].
+    """
+
+    def __init__(self, G: nx.DiGraph, capacity: str = 'capacity'):
+        if not G.is_directed():
+            G = G.to_directed()
+        self.nodes: List[Hashable] = list(G.nodes())
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        n = len(self.nodes)
+        edges = list(G.edges(data=capacity))
+        tails = np.fromiter((self.index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+        heads = np.fromiter((self.index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+
+        # Capacité absente : infinie, remplacée par un majorant de toute coupe finie
+        finite = [c for _, _, c in edges if c is not None]
+        if any(c < 0 for c in finite):
+            raise ValueError("Les capacités doivent être positives")
+        self.infinite = sum(finite) + 1
+        capacities = np.array([self.infinite if c is None else c for _, _, c in edges])
+        if not len(edges):
+            capacities = capacities.astype(np.int64)
+
+        self.head = np.empty(2 * len(edges), dtype=np.int64)
+        self.head[0::2] = heads
+        self.head[1::2] = tails
+        self.initial = capacities
+        self.cap = np.zeros(2 * len(edges), dtype=capacities.dtype)
+        self.cap[0::2] = capacities
+
+        tail = self.head[np.arange(2 * len(edges)) ^ 1]
+        self.arcs = np.argsort(tail, kind='stable')
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tail, minlength=n), out=self.indptr[1:])
+        self.edges = [(u, v) for u, v, _ in edges]
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.nodes)
+
+    def flows(self) -> np.ndarray:
+        """
+        Flot sur chaque arc du graphe, dans l'ordre de G.edges().
+        """
+        return self.initial - self.cap[0::2]
+
+    def source_side(self, source: int) -> np.ndarray:
+        """
+        Sommets atteignables depuis source dans le graphe résiduel (masque) :
+        après un flot maximum, c'est le côté source d'une coupe minimale.
+        """
+        indptr, arcs = self.indptr.tolist(), self.arcs.tolist()
+        head, cap = self.head.tolist(), self.cap.tolist()
+        seen = [False] * self.num_nodes
+        seen[source] = True
+        stack = [source]
+        while stack:
+            u = stack.pop()
+            for k in range(indptr[u], indptr[u + 1]):
+                a = arcs[k]
+                if cap[a] > 0 and not seen[head[a]]:
+                    seen[head[a]] = True
+                    stack.append(head[a])
+        return np.array(seen, dtype=bool)
+
+
+class FlowResult:
+    """
+    Flot maximum en tableaux : flow[e] est le flot de l'arc e = (tails[e],
+    heads[e]) dans l'ordre de G.edges(), et source_side le masque booléen des
+    sommets du côté source de la coupe minimale.
+
+    result[u][v] donne le flot de l'arc (u, v) comme l'ancien flow_dict de
+    networkx, sans construire de dictionnaires.
+    """
+
+    def __init__(self, residual: ResidualGraph, source: int, value: float):
+        self.value = value
+        self.nodes = residual.nodes
+        self.index = residual.index
+        self.heads = residual.head[0::2]
+        self.tails = residual.head[1::2]
+        self.capacity = residual.initial
+        self.flow = residual.flows()
+        self.source_side = residual.source_side(source)
+
+        # Arcs triés par (origine, destination) pour la recherche par sommet
+        self._order = np.lexsort((self.heads, self.tails))
+        self._sorted_heads = self.heads[self._order]
+        self._indptr = np.zeros(len(self.nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.tails, minlength=len(self.nodes)), out=self._indptr[1:])
+
+    @property
+    def sink_side(self) -> np.ndarray:
+        return ~self.source_side
+
+    @property
+    def partition(self) -> Tuple[Set, Set]:
+        """
+        Partition (côté source, côté puits) en ensembles de sommets.
+        """
+        reachable = {self.nodes[i] for i in np.flatnonzero(self.source_side).tolist()}
+        return reachable, set(self.nodes) - reachable
+
+    @property
+    def cut_arcs(self) -> np.ndarray:
+        """
+        Masque des arcs de la coupe minimale (du côté source vers le côté puits).
+        """
+        return self.source_side[self.tails] & ~self.source_side[self.heads]
+
+    @property
+    def cut_value(self):
+        return self.capacity[self.cut_arcs].sum().item()
+
+    def arc(self, u: Hashable, v: Hashable) -> int:
+        """
+        Indice de l'arc (u, v).
+        """
+        a, b = self.index[u], self.index[v]
+        start, end = int(self._indptr[a]), int(self._indptr[a + 1])
+        position = start + int(np.searchsorted(self._sorted_heads[start:end], b))
+        if position == end or self._sorted_heads[position] != b:
+            raise KeyError((u, v))
+        return int(self._order[position])
+
+    def arcs(self) -> Iterator[Tuple[Hashable, Hashable, float]]:
+        """
+        Triplets (u, v, flot) dans l'ordre de G.edges().
+        """
+        nodes = self.nodes
+        for a, b, flow in zip(self.tails.tolist(), self.heads.tolist(), self.flow.tolist()):
+            yield nodes[a], nodes[b], flow
+
+    def to_dict(self) -> Dict[Hashable, Dict[Hashable, float]]:
+        """
+        Conversion en dictionnaire de dictionnaires (format networkx).
+        """
+        flow_dict = {node: {} for node in self.nodes}
+        for u, v, flow in self.arcs():
+            flow_dict[u][v] = flow
+        return flow_dict
+
+    def __getitem__(self, u: Hashable) -> '_FlowRow':
+        if u not in self.index:
+            raise KeyError(u)
+        return _FlowRow(self, self.index[u])
+
+    def __contains__(self, u: Hashable) -> bool:
+        return u in self.index
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def keys(self):
+        return list(self.nodes)
+
+    def items(self):
+        return [(node, self[node]) for node in self.nodes]
+
+
+class _FlowRow:
+    """
+    Vue sur les arcs sortant d'un sommet d'un FlowResult.
+    """
+
+    def __init__(self, result: FlowResult, u: int):
+        self.result = result
+        self.start, self.end = int(result._indptr[u]), int(result._indptr[u + 1])
+
+    def _arcs(self) -> np.ndarray:
+        return self.result._order[self.start:self.end]
+
+    def __getitem__(self, v: Hashable):
+        result = self.result
+        if v not in result.index:
+            raise KeyError(v)
+        heads = result._sorted_heads
+        position = self.start + int(np.searchsorted(heads[self.start:self.end], result.index[v]))
+        if position == self.end or heads[position] != result.index[v]:
+            raise KeyError(v)
+        return result.flow[result._order[position]].item()
+
+    def __contains__(self, v: Hashable) -> bool:
+        try:
+            self[v]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self) -> List[Hashable]:
+        nodes = self.result.nodes
+        return [nodes[b] for b in self.result.heads[self._arcs()].tolist()]
+
+    def values(self) -> List[float]:
+        return self.result.flow[self._arcs()].tolist()
+
+    def items(self) -> List[Tuple[Hashable, float]]:
+        return list(zip(self.keys(), self.values()))
+
+    def get(self, v: Hashable, default=None):
+        try:
+            return self[v]
+        except KeyError:
+            return default
+
+
+def maximum_flow(residual: ResidualGraph, source: int, sink: int,
+                 algorithm: str = "dinic") -> float:
+    """
+    Flot maximum de source à sink, calculé en place sur le graphe résiduel.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Algorithme non supporté: {algorithm}")
+    if source == sink:
+        raise ValueError("La source et le puits doivent être distincts")
+    engine = {"dinic": _dinic, "push_relabel": _push_relabel,
+              "boykov_kolmogorov": _boykov_kolmogorov}[algorithm]
+    cap = residual.cap.tolist()
+    value = engine(residual.num_nodes, residual.indptr.tolist(), residual.arcs.tolist(),
+                   residual.head.tolist(), cap, source, sink)
+    residual.cap[:] = cap
+    if value >= residual.infinite:
+        raise ValueError("Le flot maximum est infini (chemin de capacité illimitée)")
+    return value
+
+
+def _dinic(n, indptr, arcs, head, cap, s, t):
+    """
+    Dinic : graphe de niveaux par parcours en largeur, puis flot bloquant par
+    parcours en profondeur avec pointeur d'arc courant.
+    """
+    flow = 0
+    while True:
+        level = [-1] * n
+        level[s] = 0
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            for k in range(indptr[u], indptr[u + 1]):
+                a = arcs[k]
+                if cap[a] > 0 and level[head[a]] < 0:
+                    level[head[a]] = level[u] + 1
+                    queue.append(head[a])
+        if level[t] < 0:
+            return flow
+
+        current = indptr[:-1]
+        path = []
+        u = s
+        while True:
+            if u == t:
+                pushed = min(cap[a] for a in path)
+                for a in path:
+                    cap[a] -= pushed
+                    cap[a ^ 1] += pushed
+                flow += pushed
+                # Reprendre depuis l'origine du premier arc saturé
+                k = next(i for i, a in enumerate(path) if cap[a] == 0)
+                del path[k:]
+                u = head[path[-1]] if path else s
+                continue
+
+            end = indptr[u + 1]
+            k = current[u]
+            while k < end:
+                a = arcs[k]
+                if cap[a] > 0 and level[head[a]] == level[u] + 1:
+                    break
+                k += 1
+            current[u] = k
+            if k < end:
+                path.append(arcs[k])
+                u = head[arcs[k]]
+            elif u == s:
+                break
+            else:
+                level[u] = -1  # Impasse : plus aucun flot ne passe par u
+                a = path.pop()
+                u = head[a ^ 1]
+                current[u] += 1
+
+
+def _push_relabel(n, indptr, arcs, head, cap, s, t):
+    """
+    Poussage-réétiquetage FIFO avec heuristique de trou et réétiquetage global
+    périodique (hauteurs = distances au puits, ou n + distance à la source).
+    """
+    height = [0] * n
+    excess = [0] * n
+    count = [0] * (2 * n + 1)
+    current = indptr[:-1]
+    queued = [False] * n
+    queue = deque()
+
+    def global_relabel():
+        for v in range(n):
+            height[v] = 2 * n
+        height[t], height[s] = 0, n
+        for root in (t, s):
+            frontier = deque([root])
+            while frontier:
+                v = frontier.popleft()
+                for k in range(indptr[v], indptr[v + 1]):
+                    a = arcs[k]
+                    u = head[a]
+                    if cap[a ^ 1] > 0 and height[u] == 2 * n:
+                        height[u] = height[v] + 1
+                        frontier.append(u)
+        for v in range(n):
+            count[v] = 0
+        for i in range(n, 2 * n + 1):
+            count[i] = 0
+        for v in range(n):
+            count[height[v]] += 1
+            current[v] = indptr[v]
+
+    for k in range(indptr[s], indptr[s + 1]):
+        a = arcs[k]
+        if cap[a] > 0:
+            v = head[a]
+            excess[v] += cap[a]
+            excess[s] -= cap[a]
+            cap[a ^ 1] += cap[a]
+            cap[a] = 0
+            if v != t and v != s and not queued[v]:
+                queued[v] = True
+                queue.append(v)
+    global_relabel()
+    relabels = 0
+
+    while queue:
+        u = queue.popleft()
+        queued[u] = False
+        end = indptr[u + 1]
+        while excess[u] > 0:
+            k = current[u]
+            if k == end:
+                # Réétiquetage
+                old = height[u]
+                new = 2 * n
+                for j in range(indptr[u], end):
+                    a = arcs[j]
+                    if cap[a] > 0 and height[head[a]] + 1 < new:
+                        new = height[head[a]] + 1
+                count[old] -= 1
+                height[u] = new
+                count[new] += 1
+                current[u] = indptr[u]
+                relabels += 1
+                if count[old] == 0 and old < n:
+                    # Trou : les sommets au-dessus ne peuvent plus atteindre le puits
+                    for v in range(n):
+                        if old < height[v] < n:
+                            count[height[v]] -= 1
+                            height[v] = n + 1
+                            count[n + 1] += 1
+                if relabels >= n:
+                    relabels = 0
+                    global_relabel()
+                if height[u] >= 2 * n:
+                    break
+                continue
+            a = arcs[k]
+            v = head[a]
+            if cap[a] > 0 and height[u] == height[v] + 1:
+                pushed = excess[u] if excess[u] < cap[a] else cap[a]
+                cap[a] -= pushed
+                cap[a ^ 1] += pushed
+                excess[u] -= pushed
+                excess[v] += pushed
+                if v != s and v != t and not queued[v]:
+                    queued[v] = True
+                    queue.append(v)
+            else:
+                current[u] = k + 1
+        if excess[u] > 0 and height[u] < 2 * n and not queued[u]:
+            queued[u] = True
+            queue.append(u)
+    return excess[t]
+
+
+def _boykov_kolmogorov(n, indptr, arcs, head, cap, s, t):
+    """
+    Boykov-Kolmogorov : deux arbres de recherche (depuis la source et depuis le
+    puits) croissent jusqu'à se toucher ; après augmentation, les sommets
+    détachés par des arcs saturés sont réadoptés plutôt que de tout reprendre.
+    """
+    FREE, SOURCE, SINK = 0, 1, 2
+    tree = [FREE] * n
+    parent = [-1] * n  # Arc parent -> v (arbre source) ou v -> parent (arbre puits)
+    tree[s], tree[t] = SOURCE, SINK
+    active = deque([s, t])
+    flow = 0
+
+    def tail(a):
+        return head[a ^ 1]
+
+    def rooted(v):
+        # Le sommet remonte-t-il jusqu'à sa racine ?
+        while v != s and v != t:
+            a = parent[v]
+            if a < 0:
+                return False
+            v = tail(a) if tree[v] == SOURCE else head[a]
+        return True
+
+    while active:
+        p = active[0]
+        if tree[p] == FREE:
+            active.popleft()
+            continue
+
+        # Croissance
+        bridge = -1
+        for k in range(indptr[p], indptr[p + 1]):
+            a = arcs[k]
+            q = head[a]
+            residual = cap[a] if tree[p] == SOURCE else cap[a ^ 1]
+            if residual <= 0:
+                continue
+            if tree[q] == FREE:
+                tree[q] = tree[p]
+                parent[q] = a if tree[p] == SOURCE else a ^ 1
+                active.append(q)
+            elif tree[q] != tree[p]:
+                bridge = a if tree[p] == SOURCE else a ^ 1
+                break
+        if bridge < 0:
+            active.popleft()
+            continue
+
+        # Augmentation le long de source -> ... -> pont -> ... -> puits
+        path = [bridge]
+        v = tail(bridge)
+        while v != s:
+            path.append(parent[v])
+            v = tail(parent[v])
+        v = head[bridge]
+        while v != t:
+            path.append(parent[v])
+            v = head[parent[v]]
+        pushed = min(cap[a] for a in path)
+        orphans = []
+        for a in path:
+            cap[a] -= pushed
+            cap[a ^ 1] += pushed
+            if cap[a] == 0 and a != bridge:
+                u, v = tail(a), head[a]
+                if tree[u] == SOURCE and tree[v] == SOURCE:
+                    parent[v] = -1
+                    orphans.append(v)
+                elif tree[u] == SINK and tree[v] == SINK:
+                    parent[u] = -1
+                    orphans.append(u)
+        flow += pushed
+
+        # Adoption des orphelins
+        while orphans:
+            o = orphans.pop()
+            side = tree[o]
+            adopted = False
+            for k in range(indptr[o], indptr[o + 1]):
+                a = arcs[k]
+                q = head[a]
+                into = a ^ 1 if side == SOURCE else a  # Arc q -> o ou o -> q
+                if tree[q] == side and cap[into] > 0 and rooted(q):
+                    parent[o] = into
+                    adopted = True
+                    break
+            if adopted:
+                continue
+            for k in range(indptr[o], indptr[o + 1]):
+                a = arcs[k]
+                q = head[a]
+                if tree[q] != side:
+                    continue
+                into = a ^ 1 if side == SOURCE else a
+                if cap[into] > 0:
+                    active.append(q)
+                if parent[q] >= 0 and (tail(parent[q]) if side == SOURCE else head[parent[q]]) == o:
+                    parent[q] = -1
+                    orphans.append(q)
+            tree[o] = FREE
+            parent[o] = -1
+    return flow
@@ -0,0 +1,103 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from algorithms.graph_arrays import CSRGraph
+from algorithms.graph_coloring import degree_order
+from algorithms.shared_arrays import attach, release, share
+
+# Tableaux partagés attachés dans chaque processus de calcul
+_worker: Dict[str, object] = {}
+
+
+def parallel_coloring(graph: CSRGraph, max_workers: Optional[int] = None,
+                      chunks_per_worker: int = 4, seed: int = 0) -> np.ndarray:
+    """
+    Coloration spéculative en parallèle (Gebremedhin-Manne) sur un pool de
+    processus.
+
+    À chaque tour, les sommets à colorer (pris par degré décroissant) sont
+    répartis entre les processus, qui les colorent en même temps au plus petit
+    indice libre d'après les couleurs déjà publiées en mémoire partagée. Deux
+    voisins colorés simultanément peuvent recevoir la même couleur : ces
+    conflits sont détectés sur l'ensemble des arêtes et, pour chaque conflit,
+    le sommet de plus faible priorité (tirée au hasard) est recoloré au tour
+    suivant. Le nombre de sommets à recolorer décroît strictement à chaque tour.
+    """
+    n = graph.num_nodes
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    max_workers = max_workers or os.cpu_count() or 1
+    priority = np.random.default_rng(seed).permutation(n)
+    sources, targets, _ = graph.edges()
+    loops = sources == targets
+    sources, targets = sources[~loops], targets[~loops]
+
+    segments = [share(graph.indptr), share(graph.indices),
+                share(np.full(n, -1, dtype=np.int64))]
+    colors = np.ndarray((n,), dtype=np.int64, buffer=segments[2][0].buf)
+    try:
+        names = [(shm.name, shape, dtype) for shm, shape, dtype in segments]
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach,
+                                 initargs=(names,)) as executor:
+            pending = degree_order(graph)
+            rank = np.empty(n, dtype=np.int64)
+            rank[pending] = np.arange(n)
+            while len(pending):
+                tasks = min(len(pending), max_workers * chunks_per_worker)
+                list(executor.map(_color_chunk, [pending[k::tasks] for k in range(tasks)]))
+
+                # Conflits : le sommet de plus faible priorité perd sa couleur
+                conflict = (colors[sources] == colors[targets]) & \
+                           (priority[sources] < priority[targets])
+                pending = np.unique(sources[conflict])
+                pending = pending[np.argsort(rank[pending])]
+                colors[pending] = -1
+        return colors.copy()
+    finally:
+        del colors
+        for shm, _, _ in segments:
+            release(shm)
+
+
+def _attach(names: List[Tuple[str, Tuple[int, ...], str]]) -> None:
+    """
+    Initialisation d'un processus de calcul : attache les tableaux partagés
+    (structure du graphe et couleurs), sans copie.
+    """
+    segments, arrays = zip(*(attach(*name) for name in names))
+    _worker['segments'] = segments
+    _worker['indptr'], _worker['indices'], _worker['colors'] = arrays
+
+
+def _color_chunk(vertices: np.ndarray) -> None:
+    """
+    Colore un bloc de sommets au plus petit indice libre (first-fit), en
+    partant des couleurs publiées au début du bloc. Seules les listes
+    d'adjacence du bloc et les couleurs de ses voisins sont lues.
+    """
+    indptr, indices = _worker['indptr'], _worker['indices']
+    shared = _worker['colors']
+    starts = indptr[vertices]
+    counts = indptr[vertices + 1] - starts
+    bounds = np.cumsum(counts)
+    neighbors = indices[np.repeat(starts - bounds + counts, counts) + np.arange(int(bounds[-1]))]
+    published = shared[neighbors].tolist()
+    neighbors = neighbors.tolist()
+
+    # Une couleur first-fit ne dépasse pas le degré du sommet
+    stamp = [-1] * (int(counts.max()) + 2)
+    chosen: Dict[int, int] = {}  # Couleurs attribuées dans ce bloc
+    first = 0
+    for node, last in zip(vertices.tolist(), bounds.tolist()):
+        for k in range(first, last):
+            color = chosen.get(neighbors[k], published[k])
+            if 0 <= color < len(stamp):
+                stamp[color] = node
+        color = 0
+        while stamp[color] == node:
+            color += 1
+        chosen[node] = color
+        first = last
+
+    shared[vertices] = [chosen[node] for node in vertices.tolist()]
@@ -0,0 +1,102 @@
+from collections import OrderedDict
+import networkx as nx
+import numpy as np
+from typing import Dict, Hashable, List, Optional, Tuple
+from algorithms.bellman_ford import NegativeCycleError, bellman_ford_arrays
+from algorithms.graph_arrays import CSRGraph
+from algorithms.shortest_paths import path_from_tree, shortest_path_tree
+from config.settings import GRAPH_SETTINGS
+
+METHODS = ("dijkstra", "bellman_ford")
+
+
+class ShortestPathQuery:
+    """
+    Requêtes répétées de plus courts chemins sur un même graphe.
+
+    L'arbre des plus courts chemins (distances et prédécesseurs) de chaque
+    source interrogée est gardé dans un cache LRU borné : une requête depuis une
+    source en cache ne fait que remonter les prédécesseurs, en O(longueur du
+    chemin). Chaque modification du graphe faite par cet objet incrémente un
+    numéro de version qui invalide les arbres calculés auparavant ; après une
+    modification directe du graphe, appeler invalidate().
+    """
+
+    def __init__(self, G: nx.Graph, weight: str = 'weight', max_sources: Optional[int] = None):
+        self.G = G
+        self.weight = weight
+        self.max_sources = max_sources or GRAPH_SETTINGS['PATH_CACHE_SIZE']
+        self.version = 0
+        # (méthode, source) -> (version, distances, prédécesseurs)
+        self._trees: 'OrderedDict[Tuple[str, Hashable], Tuple[int, Dict, Dict]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def query(self, source: Hashable, target: Hashable,
+              method: str = "dijkstra") -> Tuple[List[Hashable], float]:
+        """
+        Plus court chemin de source à target. method : 'dijkstra' (poids
+        positifs) ou 'bellman_ford' (poids négatifs admis).
+        """
+        dist, pred = self.tree(source, method)
+        if target not in dist:
+            if target not in self.G:
+                raise ValueError(f"Le sommet {target} n'est pas dans le graphe")
+            raise ValueError("Aucun chemin n'existe entre les sommets spécifiés")
+        return path_from_tree(pred, target), dist[target]
+
+    def distance(self, source: Hashable, target: Hashable, method: str = "dijkstra") -> float:
+        return self.query(source, target, method)[1]
+
+    def tree(self, source: Hashable, method: str = "dijkstra") -> Tuple[Dict, Dict]:
+        """
+        Arbre des plus courts chemins depuis source, calculé au besoin.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Méthode non supportée: {method}")
+        key = (method, source)
+        entry = self._trees.get(key)
+        if entry is not None and entry[0] == self.version:
+            self._trees.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+        self.misses += 1
+        if source not in self.G:
+            raise ValueError(f"Le sommet {source} n'est pas dans le graphe")
+        if method == "dijkstra":
+            dist, pred = shortest_path_tree(self.G, source, self.weight)
+        else:
+            graph = CSRGraph.from_networkx(self.G, weight=self.weight)
+            try:
+                distances, parents = bellman_ford_arrays(graph, graph.index[source])
+            except NegativeCycleError as error:
+                raise NegativeCycleError([graph.nodes[i] for i in error.cycle]) from None
+            reached = np.flatnonzero(np.isfinite(distances)).tolist()
+            dist = {graph.nodes[i]: float(distances[i]) for i in reached}
+            pred = {graph.nodes[i]: (graph.nodes[parents[i]] if parents[i] >= 0 else None)
+                    for i in reached}
+
+        self._trees[key] = (self.version, dist, pred)
+        self._trees.move_to_end(key)
+        while len(self._trees) > self.max_sources:
+            self._trees.popitem(last=False)
+        return dist, pred
+
+    def invalidate(self) -> None:
+        """
+        Signale une modification du graphe : tous les arbres en cache sont périmés.
+        """
+        self.version += 1
+
+    def add_edge(self, u: Hashable, v: Hashable, weight: float = 1) -> None:
+        self.G.add_edge(u, v, **{self.weight: weight})
+        self.invalidate()
+
+    def remove_edge(self, u: Hashable, v: Hashable) -> None:
+        self.G.remove_edge(u, v)
+        self.invalidate()
+
+    def set_weight(self, u: Hashable, v: Hashable, weight: float) -> None:
+        self.G[u][v][self.weight] = weight
+        self.invalidate()
@@ -0,0 +1,191 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+from algorithms.scheduling import _successors, metra, task_arrays
+from config.settings import GRAPH_SETTINGS
+
+DISTRIBUTIONS = ("pert", "triangulaire")
+PERCENTILES = (50, 80, 90, 95)
+
+# Simulation attachée dans chaque processus de calcul
+_worker: Dict[str, object] = {}
+
+
+class SimulationResult(NamedTuple):
+    tasks: List[Hashable]
+    durations: np.ndarray          # Durée du projet dans chaque scénario
+    percentiles: Dict[float, float]
+    criticality: np.ndarray        # Part des scénarios où chaque tâche est critique
+
+
+class PertSimulation:
+    """
+    Simulation de Monte-Carlo de la durée d'un projet METRA à durées incertaines.
+
+    Chaque tâche peut donner, en plus de 'duration' (valeur la plus probable),
+    'optimistic' et 'pessimistic', et 'distribution' parmi DISTRIBUTIONS
+    (loi bêta-PERT ou triangulaire) ; sans bornes, sa durée est fixe. Les
+    scénarios sont tirés par blocs, en une matrice (tâches x scénarios), et les
+    dates de tous les scénarios d'un bloc sont calculées ensemble, niveau
+    topologique par niveau topologique, par opérations vectorisées.
+    """
+
+    def __init__(self, tasks: Dict[Hashable, Dict], distribution: str = "pert"):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Distribution non supportée: {distribution}")
+        self.tasks, likely, indptr, indices = task_arrays(tasks)
+        n = len(self.tasks)
+        likely = likely.astype(float)
+        low = np.array([tasks[task].get('optimistic', m) for task, m in zip(self.tasks, likely)],
+                       dtype=float)
+        high = np.array([tasks[task].get('pessimistic', m) for task, m in zip(self.tasks, likely)],
+                        dtype=float)
+        if n and ((low > likely) | (likely > high) | (low < 0)).any():
+            raise ValueError("Il faut 0 <= optimiste <= durée <= pessimiste pour chaque tâche")
+        kinds = [tasks[task].get('distribution', distribution) for task in self.tasks]
+        for kind in set(kinds):
+            if kind not in DISTRIBUTIONS:
+                raise ValueError(f"Distribution non supportée: {kind}")
+        kinds = np.array([kind == "pert" for kind in kinds], dtype=bool)
+
+        width = high - low
+        spread = np.divide(likely - low, width, out=np.full(n, 0.5), where=width > 0)
+        self.low, self.width, self.spread = low, width, spread
+        # Loi bêta-PERT : a + (b - a) * Bêta(1 + 4 (m - a) / (b - a), 1 + 4 (b - m) / (b - a))
+        self.pert = np.flatnonzero(kinds & (width > 0))
+        self.triangular = np.flatnonzero(~kinds & (width > 0))
+        self.fixed = np.flatnonzero(width == 0)
+        self.alpha = 1 + 4 * spread[self.pert]
+        self.beta = 1 + 4 * (1 - spread[self.pert])
+
+        # Niveaux topologiques : dates au plus tôt avec des durées unitaires
+        # (détecte aussi les cycles)
+        level = metra(np.ones(n, dtype=np.int64), indptr, indices).early_start
+        order = np.argsort(level, kind='stable')
+        bounds = np.searchsorted(level[order], np.arange(level.max() + 2 if n else 1))
+        self.levels = [order[bounds[k]:bounds[k + 1]] for k in range(len(bounds) - 1)]
+        self.sources = self.levels[0] if n else np.zeros(0, dtype=np.int64)
+
+        successors, succ_indptr = _successors(n, indptr, indices)
+        succ_counts = np.diff(succ_indptr)
+        # Pour chaque niveau : voisins des tâches en colonnes, pour la passe
+        # avant (prédécesseurs) et la passe arrière (successeurs)
+        self.forward = [_segments(nodes, indptr, indices) for nodes in self.levels[1:]]
+        self.backward = [_segments(nodes[succ_counts[nodes] > 0], succ_indptr, successors)
+                         for nodes in self.levels]
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """
+        Durées de size scénarios, en matrice (tâches x scénarios).
+        """
+        durations = np.empty((len(self.tasks), size))
+        durations[self.fixed] = (self.low + self.width * self.spread)[self.fixed, None]
+        if len(self.pert):
+            draws = rng.beta(self.alpha[:, None], self.beta[:, None], (len(self.pert), size))
+            durations[self.pert] = self.low[self.pert, None] + self.width[self.pert, None] * draws
+        if len(self.triangular):
+            # Inversion de la fonction de répartition triangulaire
+            tri = self.triangular
+            u = rng.random((len(tri), size))
+            c = self.spread[tri, None]
+            left = np.sqrt(u * c)
+            right = 1 - np.sqrt((1 - u) * (1 - c))
+            durations[tri] = self.low[tri, None] + self.width[tri, None] * np.where(u < c, left, right)
+        return durations
+
+    def evaluate(self, durations: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Durée du projet et masque des tâches critiques pour une matrice de
+        durées (tâches x scénarios).
+        """
+        finish = np.empty_like(durations)
+        finish[self.sources] = durations[self.sources]
+        for nodes, columns in self.forward:
+            latest = _column_max(finish, columns)
+            latest += durations[nodes]
+            finish[nodes] = latest
+        project = finish.max(axis=0) if len(durations) else np.zeros(durations.shape[1])
+
+        # Reste : durée de la tâche plus le plus long chemin de sa fin à la fin
+        # du projet ; la tâche est critique si début + reste = durée du projet
+        rest = durations.copy()
+        for nodes, columns in reversed(self.backward):
+            if len(nodes):
+                rest[nodes] += _column_max(rest, columns)
+        tolerance = 1e-9 * np.maximum(1.0, project)
+        critical = finish - durations + rest >= project - tolerance
+        return project, critical
+
+    def run(self, scenarios: int = 10000, percentiles: Sequence[float] = PERCENTILES,
+            seed: Optional[int] = None, max_workers: int = 1,
+            chunk: Optional[int] = None) -> SimulationResult:
+        """
+        Tire scenarios scénarios par blocs de chunk. Avec max_workers > 1, les
+        blocs sont répartis sur un pool de processus ; chaque bloc a son propre
+        flux aléatoire dérivé de seed, donc le résultat ne dépend pas du
+        nombre de processus.
+        """
+        if scenarios <= 0:
+            raise ValueError("Le nombre de scénarios doit être positif")
+        chunk = chunk or GRAPH_SETTINGS['SIMULATION_CHUNK']
+        sizes = [min(chunk, scenarios - first) for first in range(0, scenarios, chunk)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+        if max_workers == 1:
+            _attach(self)
+            results = [_simulate(s, size) for s, size in zip(seeds, sizes)]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                                     initializer=_attach, initargs=(self,)) as executor:
+                results = list(executor.map(_simulate, seeds, sizes))
+
+        durations = np.concatenate([project for project, _ in results])
+        critical = sum(counts for _, counts in results)
+        values = np.percentile(durations, percentiles) if len(percentiles) else []
+        return SimulationResult(self.tasks, durations,
+                                dict(zip(percentiles, np.asarray(values).tolist())),
+                                critical / scenarios)
+
+
+def _segments(nodes: np.ndarray, indptr: np.ndarray,
+              indices: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Voisins (au sens du CSR indptr/indices) des tâches nodes, en colonnes :
+    les tâches sont triées par nombre de voisins décroissant, et la colonne j
+    donne le j-ième voisin des len(colonne) premières tâches.
+    """
+    counts = indptr[nodes + 1] - indptr[nodes]
+    by_count = np.argsort(-counts, kind='stable')
+    nodes, counts = nodes[by_count], counts[by_count]
+    columns = []
+    for j in range(int(counts[0]) if len(counts) else 0):
+        first = nodes[:np.count_nonzero(counts > j)]
+        columns.append(indices[indptr[first] + j])
+    return nodes, columns
+
+
+def _column_max(values: np.ndarray, columns: List[np.ndarray]) -> np.ndarray:
+    """
+    Maximum des lignes de values désignées par chaque colonne de voisins :
+    chaque colonne ne touche qu'un préfixe du résultat.
+    """
+    best = values[columns[0]]
+    for column in columns[1:]:
+        head = best[:len(column)]
+        np.maximum(head, values[column], out=head)
+    return best
+
+
+def _attach(simulation: PertSimulation) -> None:
+    _worker['simulation'] = simulation
+
+
+def _simulate(seed: np.random.SeedSequence, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Un bloc de scénarios : durées du projet et nombre de scénarios où chaque
+    tâche est critique.
+    """
+    simulation = _worker['simulation']
+    project, critical = simulation.evaluate(simulation.sample(np.random.default_rng(seed), size))
+    return project, critical.sum(axis=1)
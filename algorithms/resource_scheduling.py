@@ -0,0 +1,133 @@
+import heapq
+import numpy as np
+from typing import Dict, Hashable, List, NamedTuple
+from algorithms.scheduling import metra, task_arrays
+
+RULES = ("fin_tardive", "marge")
+
+
+class ResourceSchedule(NamedTuple):
+    tasks: List[Hashable]
+    start: np.ndarray
+    finish: np.ndarray
+    order: np.ndarray      # Ordre dans lequel les tâches ont été placées
+    duration: int          # Durée totale du projet
+
+
+class ResourceProfile:
+    """
+    Capacités libres des ressources par unité de temps, en un tableau
+    (ressources x instants) agrandi au besoin.
+
+    La recherche du premier créneau libre se fait par fenêtres vectorisées : les
+    instants où une ressource demandée manque sont repérés d'un bloc, et les
+    sommes cumulées donnent le premier début suivi de d instants sans manque.
+    Les trous trop courts d'un profil fragmenté sont ainsi écartés ensemble,
+    au lieu d'un saut à la fois.
+    """
+
+    def __init__(self, capacities: List[int], horizon: int):
+        self.capacities = np.array(capacities, dtype=np.int64)
+        self.free = np.repeat(self.capacities[:, None], max(horizon, 1), axis=1)
+
+    def earliest(self, start: int, length: int, resources: np.ndarray, amounts: np.ndarray) -> int:
+        """
+        Premier instant t >= start tel que chaque ressource suffise sur
+        [t, t + length).
+        """
+        if not length or not len(resources):
+            return start
+        needed = amounts[:, None]
+        span = max(64, 4 * length)
+        while True:
+            self._reserve_horizon(start + span + length)
+            window = self.free[resources, start:start + span + length]
+            missing = np.zeros(window.shape[1] + 1, dtype=np.int64)
+            np.cumsum((window < needed).any(axis=0), out=missing[1:])
+            fits = np.flatnonzero(missing[length:] == missing[:-length])
+            if len(fits):
+                return start + int(fits[0])
+            start += span + 1
+            span *= 2
+
+    def reserve(self, start: int, length: int, resources: np.ndarray, amounts: np.ndarray) -> None:
+        """
+        Retire les quantités utilisées sur [start, start + length).
+        """
+        self._reserve_horizon(start + length)
+        self.free[resources, start:start + length] -= amounts[:, None]
+
+    def _reserve_horizon(self, horizon: int) -> None:
+        if horizon > self.free.shape[1]:
+            extra = np.repeat(self.capacities[:, None], max(horizon, 2 * self.free.shape[1]) -
+                              self.free.shape[1], axis=1)
+            self.free = np.concatenate([self.free, extra], axis=1)
+
+
+def resource_schedule(tasks: Dict[Hashable, Dict], capacities: Dict[Hashable, int],
+                      rule: str = "fin_tardive") -> ResourceSchedule:
+    """
+    Ordonnancement sous contraintes de ressources, par le schéma de génération
+    série. Chaque tâche peut donner 'resources' : {ressource: quantité}, les
+    capacités étant constantes dans le temps et les durées entières.
+
+    Les dates METRA (sans contrainte de ressources) donnent les priorités :
+    fin au plus tard ('fin_tardive') ou marge totale ('marge'), la plus petite
+    d'abord, puis le début au plus tôt. Parmi les tâches dont tous les
+    prédécesseurs sont placés (tas de priorité), on place la plus prioritaire
+    au premier instant où ses prédécesseurs sont finis et où chaque ressource
+    suffit pendant toute sa durée (voir ResourceProfile).
+    """
+    if rule not in RULES:
+        raise ValueError(f"Règle de priorité non supportée: {rule}")
+    ids, durations, indptr, indices = task_arrays(tasks)
+    if len(durations) and not np.array_equal(durations, np.round(durations)):
+        raise ValueError("Les durées des tâches doivent être entières")
+    durations = durations.astype(np.int64)
+    dates = metra(durations, indptr, indices, ids)
+    n = len(ids)
+
+    names = list(capacities)
+    demands = np.zeros((n, len(names)), dtype=np.int64)
+    for i, task in enumerate(ids):
+        for name, amount in tasks[task].get('resources', {}).items():
+            if name not in capacities:
+                raise ValueError(f"Ressource inconnue: {name}")
+            if amount < 0 or amount > capacities[name]:
+                raise ValueError(f"La tâche {task} demande {amount} de {name}, "
+                                 f"pour une capacité de {capacities[name]}")
+            demands[i, names.index(name)] = amount
+    # Durée METRA doublée comme horizon initial ; le profil s'agrandit au besoin
+    profile = ResourceProfile([capacities[name] for name in names], 2 * int(dates.duration) + 1)
+
+    key = (dates.late_finish if rule == "fin_tardive" else dates.total_slack).tolist()
+    early = dates.early_start.tolist()
+    length = durations.tolist()
+    preds = [indices[indptr[i]:indptr[i + 1]].tolist() for i in range(n)]
+    succs: List[List[int]] = [[] for _ in range(n)]
+    for v in range(n):
+        for p in preds[v]:
+            succs[p].append(v)
+    remaining = [len(p) for p in preds]
+
+    eligible = [(key[v], early[v], v) for v in range(n) if not remaining[v]]
+    heapq.heapify(eligible)
+    start, finish = [0] * n, [0] * n
+    order = []
+    while eligible:
+        _, _, v = heapq.heappop(eligible)
+        t = max((finish[p] for p in preds[v]), default=0)
+        d = length[v]
+        resources = np.flatnonzero(demands[v])
+        amounts = demands[v, resources]
+        t = profile.earliest(t, d, resources, amounts)
+        profile.reserve(t, d, resources, amounts)
+        start[v], finish[v] = t, t + d
+        order.append(v)
+        for s in succs[v]:
+            remaining[s] -= 1
+            if not remaining[s]:
+                heapq.heappush(eligible, (key[s], early[s], s))
+
+    return ResourceSchedule(ids, np.array(start, dtype=np.int64), np.array(finish, dtype=np.int64),
+                            np.array(order, dtype=np.int64), max(finish, default=0))
@@ -0,0 +1,229 @@
+import numpy as np
+from typing import Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+# Nombre de tâches prêtes en dessous duquel le parcours de Kahn se fait tâche
+# par tâche plutôt que par niveaux vectorisés (un niveau vectorisé coûte
+# quelques dizaines de microsecondes quelle que soit sa largeur)
+NARROW_LEVEL = 16
+
+
+class Schedule(NamedTuple):
+    tasks: List[Hashable]        # Identifiants des tâches ; les tableaux suivent cet ordre
+    order: np.ndarray            # Ordre topologique (indices)
+    early_start: np.ndarray
+    early_finish: np.ndarray
+    late_start: np.ndarray
+    late_finish: np.ndarray
+    total_slack: np.ndarray      # Marge totale : retard possible sans retarder le projet
+    free_slack: np.ndarray       # Marge libre : retard possible sans retarder un successeur
+    critical: np.ndarray         # Masque des tâches critiques (marge totale nulle)
+    critical_path: List[Hashable]
+    duration: float              # Durée totale du projet
+
+
+def task_arrays(tasks: Dict[Hashable, Dict]) -> Tuple[List[Hashable], np.ndarray,
+                                                       np.ndarray, np.ndarray]:
+    """
+    Tâches {id: {'duration', 'predecessors'}} en tableaux : identifiants,
+    durées, et prédécesseurs au format CSR (ceux de la tâche i sont
+    indices[indptr[i]:indptr[i + 1]]).
+    """
+    ids = list(tasks)
+    index = {task: i for i, task in enumerate(ids)}
+    durations = np.array([tasks[task]['duration'] for task in ids])
+    if len(durations) and (durations < 0).any():
+        raise ValueError("Les durées des tâches doivent être positives")
+    indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+    np.cumsum([len(tasks[task]['predecessors']) for task in ids], out=indptr[1:])
+    try:
+        indices = np.fromiter((index[pred] for task in ids for pred in tasks[task]['predecessors']),
+                              dtype=np.int64, count=int(indptr[-1]))
+    except KeyError as error:
+        raise ValueError(f"Prédécesseur inconnu: {error.args[0]}") from None
+    return ids, durations, indptr, indices
+
+
+def schedule(tasks: Dict[Hashable, Dict]) -> Schedule:
+    """
+    Ordonnancement METRA d'un projet décrit par un dictionnaire de tâches.
+    """
+    ids, durations, indptr, indices = task_arrays(tasks)
+    return metra(durations, indptr, indices, ids)
+
+
+def metra(durations: np.ndarray, indptr: np.ndarray, indices: np.ndarray,
+          tasks: Optional[List[Hashable]] = None) -> Schedule:
+    """
+    Méthode des potentiels (METRA) sur les tableaux de tâches, en O(V + E).
+
+    Un seul parcours de Kahn par niveaux donne l'ordre topologique et les
+    dates au plus tôt : chaque niveau large (tâches dont tous les
+    prédécesseurs sont placés) est traité d'un bloc par opérations
+    vectorisées ; tant que les tâches prêtes sont moins de NARROW_LEVEL, elles
+    sont traitées une à une (voir _kahn_tasks), le coût fixe des opérations
+    vectorisées dépassant alors le travail utile. S'il reste des tâches non
+    placées, le graphe contient un cycle. Les dates au plus tard sont ensuite
+    obtenues en parcourant les blocs à rebours.
+    """
+    n = len(durations)
+    durations = np.ascontiguousarray(durations)
+    tasks = list(range(n)) if tasks is None else tasks
+    successors, succ_indptr = _successors(n, indptr, indices)
+
+    early_start = np.zeros(n, dtype=durations.dtype)
+    remaining = np.diff(indptr)
+    succ_counts = np.diff(succ_indptr)
+    stamp = np.zeros(n, dtype=np.int64)
+    frontier = np.flatnonzero(remaining == 0)
+    # Par bloc : tâches, nombre de successeurs de chacune et successeurs
+    # concaténés, gardés pour la passe arrière (None pour un bloc traité tâche
+    # par tâche)
+    levels = []
+    placed = 0
+    while len(frontier):
+        if len(frontier) < NARROW_LEVEL:
+            queue = frontier.tolist()
+            done = _kahn_tasks(queue, early_start, remaining, successors, succ_indptr, durations)
+            levels.append((np.array(queue[:done], dtype=np.int64), None, None))
+            placed += done
+            frontier = np.array(queue[done:], dtype=np.int64)
+            continue
+        counts = succ_counts[frontier]
+        ends = np.cumsum(counts)
+        total = int(ends[-1])
+        arcs = np.repeat(succ_indptr[frontier] - ends + counts, counts) + np.arange(total)
+        targets = successors[arcs]
+        levels.append((frontier, counts, targets))
+        placed += len(frontier)
+        finish = np.repeat(early_start[frontier] + durations[frontier], counts)
+        np.maximum.at(early_start, targets, finish)
+        np.subtract.at(remaining, targets, 1)
+        # Tâches devenues prêtes, chacune une seule fois : parmi ses
+        # occurrences, seule celle dont la position a été écrite en dernier
+        # (peu importe laquelle) est gardée
+        ready = targets[remaining[targets] == 0]
+        positions = np.arange(len(ready))
+        stamp[ready] = positions
+        frontier = ready[stamp[ready] == positions]
+    if placed < n:
+        raise ValueError("Le graphe des tâches contient des cycles")
+
+    early_finish = early_start + durations
+    duration = early_finish.max().item() if n else 0
+
+    late_finish = np.full(n, duration, dtype=early_finish.dtype)
+    late_start = late_finish - durations
+    for frontier, counts, targets in reversed(levels):
+        if counts is None:
+            _late_tasks(frontier.tolist(), late_finish, late_start, successors, succ_indptr,
+                        durations)
+        elif len(targets):
+            np.minimum.at(late_finish, np.repeat(frontier, counts), late_start[targets])
+            late_start[frontier] = late_finish[frontier] - durations[frontier]
+    total_slack = late_start - early_start
+
+    # Marge libre : début au plus tôt du premier successeur (ou fin du projet)
+    first_successor = np.full(n, duration, dtype=early_finish.dtype)
+    np.minimum.at(first_successor, indices, np.repeat(early_start, np.diff(indptr)))
+    free_slack = first_successor - early_finish
+
+    critical = total_slack <= _tolerance(duration)
+    order = np.concatenate([level[0] for level in levels]) if levels else np.zeros(0, dtype=np.int64)
+    path = _critical_path(early_start, early_finish, critical, successors, succ_indptr,
+                          _tolerance(duration))
+    return Schedule(tasks, order, early_start, early_finish, late_start, late_finish,
+                    total_slack, free_slack, critical, [tasks[i] for i in path], duration)
+
+
+def _kahn_tasks(queue: List[int], early_start: np.ndarray, remaining: np.ndarray,
+                successors: np.ndarray, succ_indptr: np.ndarray, durations: np.ndarray) -> int:
+    """
+    Parcours de Kahn tâche par tâche depuis les tâches prêtes de queue, qui
+    reçoit à la suite les tâches devenues prêtes, tant que moins de
+    NARROW_LEVEL tâches attendent. Les tableaux sont lus et modifiés en place
+    à travers des memoryview, sans copie. Renvoie le nombre de tâches
+    traitées : les suivantes de queue forment le prochain niveau.
+    """
+    early, left = memoryview(early_start), memoryview(remaining)
+    succ, ptr, length = memoryview(successors), memoryview(succ_indptr), memoryview(durations)
+    position = 0
+    while position < len(queue) and len(queue) - position < NARROW_LEVEL:
+        v = queue[position]
+        position += 1
+        finish = early[v] + length[v]
+        for s in succ[ptr[v]:ptr[v + 1]]:
+            if finish > early[s]:
+                early[s] = finish
+            count = left[s] - 1
+            left[s] = count
+            if not count:
+                queue.append(s)
+    return position
+
+
+def _late_tasks(order: List[int], late_finish: np.ndarray, late_start: np.ndarray,
+                successors: np.ndarray, succ_indptr: np.ndarray, durations: np.ndarray) -> None:
+    """
+    Dates au plus tard d'un bloc traité tâche par tâche, dans l'ordre inverse
+    de order.
+    """
+    finish, start = memoryview(late_finish), memoryview(late_start)
+    succ, ptr, length = memoryview(successors), memoryview(succ_indptr), memoryview(durations)
+    for v in reversed(order):
+        best = finish[v]
+        for s in succ[ptr[v]:ptr[v + 1]]:
+            if start[s] < best:
+                best = start[s]
+        finish[v] = best
+        start[v] = best - length[v]
+
+
+def _tolerance(duration) -> float:
+    """
+    Marge en dessous de laquelle une tâche est critique (dates réelles).
+    """
+    return 1e-9 * max(1.0, abs(float(duration)))
+
+
+def _successors(n: int, indptr: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Successeurs au format CSR, à partir des prédécesseurs.
+    """
+    owners = np.repeat(np.arange(n), np.diff(indptr))
+    by_pred = np.argsort(indices)
+    succ_indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=n), out=succ_indptr[1:])
+    return owners[by_pred], succ_indptr
+
+
+def _critical_path(early_start, early_finish, critical, successors, succ_indptr,
+                   tolerance: float) -> List[int]:
+    """
+    Un chemin critique : d'une tâche critique commençant à 0, on suit un
+    successeur critique qui commence dès la fin de la tâche courante (le
+    premier de chaque tâche, choisi d'un bloc sur les arcs issus des tâches
+    critiques).
+    """
+    starts = np.flatnonzero(critical & (early_start <= tolerance))
+    if not len(starts):
+        return []
+    nodes = np.flatnonzero(critical)
+    counts = succ_indptr[nodes + 1] - succ_indptr[nodes]
+    ends = np.cumsum(counts)
+    arcs = np.repeat(succ_indptr[nodes] - ends + counts, counts) + np.arange(int(ends[-1]))
+    owners = np.repeat(nodes, counts)
+    targets = successors[arcs]
+    tight = critical[targets] & (np.abs(early_start[targets] - early_finish[owners]) <= tolerance)
+    owners, targets = owners[tight], targets[tight]
+    # Les arcs sont groupés par tâche : on garde le premier de chaque groupe
+    first = np.ones(len(owners), dtype=bool)
+    first[1:] = owners[1:] != owners[:-1]
+    following = np.full(len(early_start), -1, dtype=np.int64)
+    following[owners[first]] = targets[first]
+    following = memoryview(following)
+    node = int(starts[0])
+    path = [node]
+    while following[node] >= 0:
+        node = following[node]
+        path.append(node)
+    return path
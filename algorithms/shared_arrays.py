@@ -0,0 +1,32 @@
+from multiprocessing import shared_memory
+import numpy as np
+from typing import Tuple
+
+
+def share(array) -> Tuple[shared_memory.SharedMemory, Tuple[int, ...], str]:
+    """
+    Copie un tableau dans un segment de mémoire partagée ; renvoie le segment,
+    la forme et le type, qui suffisent à un autre processus pour l'attacher.
+    """
+    array = np.asarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, array.shape, array.dtype.str
+
+
+def attach(name: str, shape: Tuple[int, ...],
+           dtype: str) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """
+    Attache un segment existant et le voit comme un tableau, sans copie. Le
+    segment doit rester ouvert tant que le tableau est utilisé.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def release(shm: shared_memory.SharedMemory) -> None:
+    """
+    Ferme et supprime un segment créé par share.
+    """
+    shm.close()
+    shm.unlink()
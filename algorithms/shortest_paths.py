@@ -0,0 +1,163 @@
+import heapq
+import math
+from itertools import count
+import networkx as nx
+from typing import Callable, Dict, Hashable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+Heuristic = Union[Callable[[Hashable, Hashable], float], Mapping[Hashable, Sequence[float]]]
+
+
+class ShortestPath(NamedTuple):
+    path: List[Hashable]
+    length: float
+    settled: int  # Nombre de sommets définitivement traités par la recherche
+
+
+def dijkstra(G: nx.Graph, source: Hashable, target: Hashable,
+             weight: str = 'weight') -> ShortestPath:
+    """
+    Dijkstra point à point : une seule recherche, arrêtée dès que la cible est
+    atteinte, donne à la fois le chemin et sa longueur.
+    """
+    return astar(G, source, target, None, weight)
+
+
+def astar(G: nx.Graph, source: Hashable, target: Hashable,
+          heuristic: Optional[Heuristic] = None, weight: str = 'weight') -> ShortestPath:
+    """
+    Recherche A* : les sommets sont explorés par distance depuis la source plus
+    une estimation admissible (jamais surévaluée) de la distance restante.
+    heuristic est soit une fonction h(sommet, cible), soit un dictionnaire de
+    coordonnées (distance euclidienne, admissible si les poids sont au moins
+    les longueurs géométriques des arêtes). Sans heuristique, c'est Dijkstra.
+    """
+    _check_nodes(G, source, target)
+    estimate = _heuristic(heuristic)
+    adjacency = G.adj
+    dist = {source: 0}
+    pred = {source: None}
+    tie = count()
+    heap = [(estimate(source, target), next(tie), 0, source)]
+    settled = 0
+
+    while heap:
+        _, _, d, node = heapq.heappop(heap)
+        if d > dist[node]:
+            continue  # Entrée périmée
+        settled += 1
+        if node == target:
+            return ShortestPath(path_from_tree(pred, target), d, settled)
+        for neighbor, data in adjacency[node].items():
+            nd = d + data.get(weight, 1)
+            if nd < dist.get(neighbor, math.inf):
+                dist[neighbor] = nd
+                pred[neighbor] = node
+                heapq.heappush(heap, (nd + estimate(neighbor, target), next(tie), nd, neighbor))
+
+    raise nx.NetworkXNoPath(f"Aucun chemin entre {source} et {target}")
+
+
+def bidirectional_dijkstra(G: nx.Graph, source: Hashable, target: Hashable,
+                           weight: str = 'weight') -> ShortestPath:
+    """
+    Dijkstra bidirectionnel : une recherche depuis la source et une depuis la
+    cible (sur les arcs inversés) progressent tour à tour ; on s'arrête dès que
+    la somme des deux minima des files dépasse le meilleur chemin déjà rencontré
+    entre les deux fronts.
+    """
+    _check_nodes(G, source, target)
+    adjacency = [G.adj, G.pred if G.is_directed() else G.adj]
+    dist: List[Dict[Hashable, float]] = [{source: 0}, {target: 0}]
+    pred: List[Dict[Hashable, Optional[Hashable]]] = [{source: None}, {target: None}]
+    done = [set(), set()]
+    tie = count()
+    heaps = [[(0, next(tie), source)], [(0, next(tie), target)]]
+    best, meet = (0, source) if source == target else (math.inf, None)
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d, _, node = heapq.heappop(heaps[side])
+        if node in done[side]:
+            continue
+        done[side].add(node)
+        other = dist[1 - side]
+        for neighbor, data in adjacency[side][node].items():
+            nd = d + data.get(weight, 1)
+            if nd < dist[side].get(neighbor, math.inf):
+                dist[side][neighbor] = nd
+                pred[side][neighbor] = node
+                heapq.heappush(heaps[side], (nd, next(tie), neighbor))
+            if neighbor in other and nd + other[neighbor] < best:
+                best, meet = nd + other[neighbor], neighbor
+
+    if meet is None:
+        raise nx.NetworkXNoPath(f"Aucun chemin entre {source} et {target}")
+    # Reconstituer le chemin de part et d'autre du sommet de rencontre
+    forward = path_from_tree(pred[0], meet)
+    backward = path_from_tree(pred[1], meet)[::-1]
+    return ShortestPath(forward + backward[1:], best, len(done[0]) + len(done[1]))
+
+
+def shortest_path_tree(G: nx.Graph, source: Hashable,
+                       weight: str = 'weight') -> Tuple[Dict[Hashable, float], Dict[Hashable, Optional[Hashable]]]:
+    """
+    Arbre des plus courts chemins depuis source (Dijkstra complet) : distances
+    et prédécesseur de chaque sommet atteignable (None pour la source).
+    """
+    _check_nodes(G, source, source)
+    adjacency = G.adj
+    dist = {source: 0}
+    pred = {source: None}
+    done = set()
+    tie = count()
+    heap = [(0, next(tie), source)]
+
+    while heap:
+        d, _, node = heapq.heappop(heap)
+        if node in done:
+            continue
+        done.add(node)
+        for neighbor, data in adjacency[node].items():
+            nd = d + data.get(weight, 1)
+            if nd < dist.get(neighbor, math.inf):
+                dist[neighbor] = nd
+                pred[neighbor] = node
+                heapq.heappush(heap, (nd, next(tie), neighbor))
+    return dist, pred
+
+
+def euclidean(coordinates: Mapping[Hashable, Sequence[float]]) -> Callable[[Hashable, Hashable], float]:
+    """
+    Heuristique A* : distance euclidienne entre les coordonnées des sommets.
+    """
+    def estimate(u: Hashable, v: Hashable) -> float:
+        return math.dist(coordinates[u], coordinates[v])
+    return estimate
+
+
+def _heuristic(heuristic: Optional[Heuristic]) -> Callable[[Hashable, Hashable], float]:
+    if heuristic is None:
+        return lambda u, v: 0
+    if callable(heuristic):
+        return heuristic
+    return euclidean(heuristic)
+
+
+def _check_nodes(G: nx.Graph, source: Hashable, target: Hashable) -> None:
+    for node in (source, target):
+        if node not in G:
+            raise nx.NodeNotFound(f"Le sommet {node} n'est pas dans le graphe")
+
+
+def path_from_tree(pred: Mapping[Hashable, Optional[Hashable]], node: Hashable) -> List[Hashable]:
+    """
+    Chemin de la racine d'un arbre de recherche jusqu'à node, en remontant les
+    prédécesseurs.
+    """
+    path = []
+    while node is not None:
+        path.append(node)
+        node = pred[node]
+    return path[::-1]
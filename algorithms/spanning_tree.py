@@ -0,0 +1,123 @@
+import networkx as nx
+import numpy as np
+from typing import Hashable, List, NamedTuple, Tuple
+
+METHODS = ("kruskal", "boruvka")
+
+
+class SpanningTree(NamedTuple):
+    nodes: List[Hashable]  # Sommets dans l'ordre de G.nodes() ; u, v sont leurs indices
+    u: np.ndarray
+    v: np.ndarray
+    weight: np.ndarray
+    edges: np.ndarray      # Indices des arêtes retenues dans l'ordre de G.edges()
+    total: float
+
+
+def edge_arrays(G: nx.Graph, weight: str = 'weight') -> Tuple[List[Hashable], np.ndarray,
+                                                                 np.ndarray, np.ndarray]:
+    """
+    Arêtes de G en tableaux (u, v, poids) d'indices de sommets, dans l'ordre de
+    G.edges().
+    """
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    triples = list(G.edges(data=weight, default=1))
+    u = np.fromiter((index[a] for a, _, _ in triples), dtype=np.int64, count=len(triples))
+    v = np.fromiter((index[b] for _, b, _ in triples), dtype=np.int64, count=len(triples))
+    w = np.array([data for _, _, data in triples])
+    return nodes, u, v, w
+
+
+def minimum_spanning_tree(G: nx.Graph, weight: str = 'weight',
+                          method: str = "kruskal") -> SpanningTree:
+    """
+    Arbre (ou forêt, si G n'est pas connexe) couvrant de poids minimal.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Méthode non supportée: {method}")
+    nodes, u, v, w = edge_arrays(G, weight)
+    engine = kruskal_arrays if method == "kruskal" else boruvka_arrays
+    chosen = engine(len(nodes), u, v, w)
+    total = w[chosen].sum().item() if len(chosen) else 0
+    return SpanningTree(nodes, u[chosen], v[chosen], w[chosen], chosen, total)
+
+
+def kruskal_arrays(n: int, u: np.ndarray, v: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """
+    Kruskal : arêtes triées une seule fois (argsort stable), ensembles disjoints
+    avec union par rang et compression de chemin (par division). Renvoie les
+    indices des arêtes retenues, par poids croissant.
+    """
+    parent = list(range(n))
+    rank = [0] * n
+    us, vs = u.tolist(), v.tolist()
+    chosen = []
+
+    for e in np.argsort(w, kind='stable').tolist():
+        a, b = us[e], vs[e]
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        if rank[a] < rank[b]:
+            a, b = b, a
+        parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+        chosen.append(e)
+        if len(chosen) == n - 1:
+            break
+    return np.array(chosen, dtype=np.int64)
+
+
+def boruvka_arrays(n: int, u: np.ndarray, v: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """
+    Borůvka : à chaque tour, toutes les composantes choisissent en même temps
+    leur arête sortante la plus légère (opérations vectorisées sur l'ensemble
+    des arêtes), puis fusionnent par sauts de pointeurs. Le nombre de
+    composantes au moins divisé par deux à chaque tour borne les tours à log n.
+    Les égalités de poids sont départagées par le rang dans le tri stable, ce
+    qui donne le même arbre que kruskal_arrays.
+    """
+    order = np.argsort(w, kind='stable')
+    # Arêtes restantes par clé (rang dans le tri) croissante, extrémités
+    # remplacées par leurs composantes
+    loops = u[order] == v[order]
+    keys = np.flatnonzero(~loops)
+    a, b = u[order][keys], v[order][keys]
+    chosen = []
+
+    while len(keys):
+        outgoing = a != b
+        keys, a, b = keys[outgoing], a[outgoing], b[outgoing]
+        if not len(keys):
+            break
+
+        # Arête sortante la plus légère de chaque composante (plus petite clé)
+        best = np.full(n, len(w), dtype=np.int64)
+        np.minimum.at(best, a, keys)
+        np.minimum.at(best, b, keys)
+        roots = np.flatnonzero(best < len(w))
+        chosen.append(order[np.unique(best[roots])])
+
+        # Chaque composante pointe vers celle au bout de son arête ; les paires
+        # qui se choisissent mutuellement gardent la plus petite comme racine
+        position = np.searchsorted(keys, best[roots])
+        ends_a, ends_b = a[position], b[position]
+        target = np.arange(n)
+        target[roots] = np.where(ends_a == roots, ends_b, ends_a)
+        mutual = (target[target[roots]] == roots) & (roots < target[roots])
+        target[roots[mutual]] = roots[mutual]
+        while True:
+            jumped = target[target]
+            if np.array_equal(jumped, target):
+                break
+            target = jumped
+        a, b = target[a], target[b]
+
+    return np.concatenate(chosen) if chosen else np.zeros(0, dtype=np.int64)
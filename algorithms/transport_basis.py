@@ -0,0 +1,293 @@
+import numpy as np
+from typing import List, Optional, Set, Tuple
+
+
+class TransportBasis:
+    """
+    Base d'une solution du problème de transport.
+
+    Les m + n - 1 cellules de base forment un arbre couvrant du graphe biparti
+    sources/destinations : les sommets 0..m-1 sont les sources, m..m+n-1 les
+    destinations. L'arbre est enraciné en la source 0 (parent et profondeur de
+    chaque sommet), ce qui donne le cycle d'une cellule hors base en O(m + n).
+    Les cellules de base de quantité nulle (solutions dégénérées) restent dans
+    la base tant qu'elles n'en sortent pas par un pivot.
+    """
+
+    def __init__(self, m: int, n: int):
+        self.m, self.n = m, n
+        self.adjacency: List[Set[int]] = [set() for _ in range(m + n)]
+        self.parent = [-1] * (m + n)
+        self.depth = [0] * (m + n)
+        self.potential: Optional[np.ndarray] = None
+        self.pivots = 0  # Nombre de pivots effectués sur cette base
+
+    @classmethod
+    def from_solution(cls, solution, tolerance: float = 0.0) -> 'TransportBasis':
+        """
+        Construit la base d'une solution : les cellules de quantité strictement
+        positive, complétées par des cellules nulles si la solution est dégénérée.
+        """
+        allocation = np.asarray(solution)
+        m, n = allocation.shape
+        basis = cls(m, n)
+        component = list(range(m + n))
+
+        def find(x: int) -> int:
+            while component[x] != x:
+                component[x] = component[component[x]]
+                x = component[x]
+            return x
+
+        def link(i: int, j: int) -> bool:
+            ri, rj = find(i), find(m + j)
+            if ri == rj:
+                return False
+            component[ri] = rj
+            basis._link(i, j)
+            return True
+
+        size = 0
+        for i, j in zip(*np.nonzero(allocation > tolerance)):
+            if not link(int(i), int(j)):
+                raise ValueError("La solution initiale n'est pas une solution de base")
+            size += 1
+
+        # Compléter la base dégénérée avec des cellules nulles
+        for i in range(m):
+            if size == m + n - 1:
+                break
+            for j in range(n):
+                if link(i, j):
+                    size += 1
+                    if size == m + n - 1:
+                        break
+
+        basis._root()
+        return basis
+
+    @classmethod
+    def make_basic(cls, allocation: np.ndarray, costs,
+                   tolerance: float = 0.0) -> 'TransportBasis':
+        """
+        Base d'une solution réalisable quelconque, modifiée sur place si elle
+        n'est pas de base : tant que des cellules positives forment un cycle,
+        la quantité est déplacée le long du cycle, dans le sens qui n'augmente
+        pas le coût, jusqu'à annuler une de ses cellules. La solution obtenue
+        est une solution de base de coût au plus égal.
+        """
+        cost_matrix = np.asarray(costs, dtype=float)
+        while True:
+            cycle = cls._positive_cycle(allocation, tolerance)
+            if cycle is None:
+                return cls.from_solution(allocation, tolerance)
+            signs = [1 if k % 2 == 0 else -1 for k in range(len(cycle))]
+            if sum(sign * cost_matrix[cell] for sign, cell in zip(signs, cycle)) > 0:
+                signs = [-sign for sign in signs]
+            leaving = min((cell for sign, cell in zip(signs, cycle) if sign < 0),
+                          key=lambda cell: allocation[cell])
+            quantity = allocation[leaving]
+            for sign, cell in zip(signs, cycle):
+                allocation[cell] += sign * quantity
+            allocation[leaving] = 0
+
+    @staticmethod
+    def _positive_cycle(allocation: np.ndarray, tolerance: float) -> Optional[List[Tuple[int, int]]]:
+        """
+        Un cycle de cellules positives (dans l'ordre du stepping stone), ou None
+        si elles forment une forêt.
+        """
+        m, n = allocation.shape
+        adjacency: List[List[int]] = [[] for _ in range(m + n)]
+        component = list(range(m + n))
+
+        def find(x: int) -> int:
+            while component[x] != x:
+                component[x] = component[component[x]]
+                x = component[x]
+            return x
+
+        for i, j in zip(*np.nonzero(allocation > tolerance)):
+            i, j = int(i), int(j)
+            ri, rj = find(i), find(m + j)
+            if ri != rj:
+                component[ri] = rj
+                adjacency[i].append(m + j)
+                adjacency[m + j].append(i)
+                continue
+            # Chemin de la destination j à la source i dans la forêt
+            parent = {m + j: -1}
+            stack = [m + j]
+            while i not in parent:
+                node = stack.pop()
+                for nxt in adjacency[node]:
+                    if nxt not in parent:
+                        parent[nxt] = node
+                        stack.append(nxt)
+            nodes = [i]
+            while parent[nodes[-1]] != -1:
+                nodes.append(parent[nodes[-1]])
+            nodes.reverse()
+            cycle = [(i, j)]
+            for x, y in zip(nodes, nodes[1:]):
+                cycle.append((x, y - m) if x < m else (y, x - m))
+            return cycle
+        return None
+
+    def __len__(self) -> int:
+        return sum(len(self.adjacency[i]) for i in range(self.m))
+
+    def cells(self) -> List[Tuple[int, int]]:
+        """
+        Liste des cellules de base.
+        """
+        return [(i, j - self.m) for i in range(self.m) for j in self.adjacency[i]]
+
+    def is_basic(self, i: int, j: int) -> bool:
+        return self.m + j in self.adjacency[i]
+
+    def cycle(self, i: int, j: int) -> List[Tuple[int, int]]:
+        """
+        Cycle de la cellule hors base (i, j) : chemin de l'arbre entre la
+        destination j et la source i. Les cellules d'indice pair sont à augmenter.
+        """
+        m, parent, depth = self.m, self.parent, self.depth
+
+        # Remonter les deux extrémités jusqu'à leur ancêtre commun
+        left, right = [m + j], [i]
+        a, b = m + j, i
+        while a != b:
+            if depth[a] >= depth[b]:
+                a = parent[a]
+                left.append(a)
+            else:
+                b = parent[b]
+                right.append(b)
+        nodes = left + right[-2::-1]
+
+        cycle = [(i, j)]
+        for x, y in zip(nodes, nodes[1:]):
+            cycle.append((x, y - m) if x < m else (y, x - m))
+        return cycle
+
+    def subtree(self, node: int) -> List[int]:
+        """
+        Sommets du sous-arbre enraciné en node.
+        """
+        nodes = [node]
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for nxt in self.adjacency[current]:
+                if nxt != self.parent[current]:
+                    nodes.append(nxt)
+                    stack.append(nxt)
+        return nodes
+
+    def flows(self, supply, demand) -> np.ndarray:
+        """
+        Quantités des cellules de base imposées par l'offre et la demande, les
+        cellules hors base étant nulles. Une quantité négative signale que la base
+        n'est plus réalisable pour ces offre et demande.
+        """
+        m = self.m
+        remaining = np.concatenate([np.asarray(supply), np.asarray(demand)])
+        allocation = np.zeros((m, self.n), dtype=remaining.dtype)
+
+        # Des feuilles vers la racine : chaque sommet envoie son reste à son parent
+        for node in np.argsort(self.depth, kind='stable')[::-1].tolist():
+            parent = self.parent[node]
+            if parent < 0:
+                continue
+            quantity = remaining[node]
+            if node < m:
+                allocation[node, parent - m] = quantity
+            else:
+                allocation[parent, node - m] = quantity
+            remaining[parent] -= quantity
+        return allocation
+
+    def potentials(self, costs: np.ndarray) -> np.ndarray:
+        """
+        Calcule les potentiels (u des sources puis v des destinations) tels que
+        u[i] + v[j] = c[i][j] sur la base, en parcourant l'arbre depuis la source 0.
+        """
+        m = self.m
+        potential = np.zeros(m + self.n)
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            for nxt in self.adjacency[node]:
+                if nxt == self.parent[node]:
+                    continue
+                if node < m:
+                    potential[nxt] = costs[node, nxt - m] - potential[node]
+                else:
+                    potential[nxt] = costs[nxt, node - m] - potential[node]
+                stack.append(nxt)
+        self.potential = potential
+        return potential
+
+    def pivot(self, entering: Tuple[int, int], leaving: Tuple[int, int],
+              delta: float = 0.0) -> None:
+        """
+        Remplace la cellule sortante par la cellule entrante. Seul le sous-arbre
+        détaché par la cellule sortante est ré-enraciné ; si les potentiels sont
+        connus, ils y sont décalés du coût réduit delta de la cellule entrante.
+        """
+        m, parent = self.m, self.parent
+        ei, ej = entering
+        ri, rj = leaving
+        child = ri if parent[ri] == m + rj else m + rj
+
+        node = ei
+        while node != -1 and node != child:
+            node = parent[node]
+
+        self._unlink(ri, rj)
+        self._link(ei, ej)
+        self.pivots += 1
+        if node == child:
+            self._reattach(ei, m + ej, delta)
+        else:
+            self._reattach(m + ej, ei, -delta)
+
+    def _link(self, i: int, j: int) -> None:
+        self.adjacency[i].add(self.m + j)
+        self.adjacency[self.m + j].add(i)
+
+    def _unlink(self, i: int, j: int) -> None:
+        self.adjacency[i].discard(self.m + j)
+        self.adjacency[self.m + j].discard(i)
+
+    def _root(self) -> None:
+        """
+        Enracine l'arbre en la source 0 (parents et profondeurs).
+        """
+        self.parent = [-1] * (self.m + self.n)
+        self.depth = [0] * (self.m + self.n)
+        self._reattach(0, -1, 0.0)
+
+    def _reattach(self, root: int, anchor: int, delta: float) -> None:
+        """
+        Raccroche le sous-arbre enraciné en root sous anchor : les sources du
+        sous-arbre gagnent delta sur leur potentiel, les destinations le perdent.
+        """
+        parent, depth = self.parent, self.depth
+        parent[root] = anchor
+        depth[root] = depth[anchor] + 1 if anchor >= 0 else 0
+        subtree = [root]
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            for nxt in self.adjacency[node]:
+                if nxt == parent[node]:
+                    continue
+                parent[nxt] = node
+                depth[nxt] = depth[node] + 1
+                subtree.append(nxt)
+                stack.append(nxt)
+
+        if self.potential is not None and delta:
+            nodes = np.array(subtree)
+            self.potential[nodes] += np.where(nodes < self.m, delta, -delta)
@@ -0,0 +1,98 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from algorithms.shared_arrays import attach, release, share
+from algorithms.transport import TransportAlgorithms
+
+METHODS = ("nord_ouest", "moindre_cout", "vogel", "stepping_stone")
+
+
+class BatchResult(NamedTuple):
+    index: int  # Position de l'instance dans l'itérable d'entrée
+    solution: List[List[int]]
+    total_cost: float
+    elapsed: float  # Temps de résolution dans le processus de calcul (s)
+
+
+def solve_batch(instances: Iterable[Tuple[List[int], List[int], List[List[int]]]],
+                method: str = "stepping_stone", initial: str = "vogel",
+                max_workers: Optional[int] = None,
+                max_pending: Optional[int] = None) -> Iterator[BatchResult]:
+    """
+    Résout un lot de scénarios (offre, demande, coûts) en parallèle sur un pool
+    de processus et renvoie les résultats au fur et à mesure de leur achèvement.
+
+    Chaque matrice de coûts est copiée une seule fois en mémoire partagée (une
+    même matrice réutilisée par plusieurs scénarios n'est pas dupliquée) : les
+    tâches ne transportent que son nom, sa forme et son type. Au plus
+    max_pending scénarios sont en cours à la fois, l'itérable est donc consommé
+    au rythme des résultats.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Méthode non supportée: {method}")
+    if method == "stepping_stone" and initial not in METHODS[:3]:
+        raise ValueError(f"Méthode initiale non supportée: {initial}")
+
+    if max_pending is None:
+        max_pending = 2 * (max_workers or os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        segments = {}  # id(coûts) -> [mémoire partagée, coûts, nombre de tâches]
+        pending = {}   # future -> id(coûts)
+        instances = enumerate(instances)
+        exhausted = False
+
+        try:
+            while pending or not exhausted:
+                while not exhausted and len(pending) < max_pending:
+                    try:
+                        index, (supply, demand, costs) = next(instances)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    key = id(costs)
+                    if key not in segments:
+                        segments[key] = [share(costs), costs, 0]
+                    segment = segments[key]
+                    segment[2] += 1
+                    shm, shape, dtype = segment[0]
+                    future = executor.submit(_solve_shared, index, supply, demand,
+                                             shm.name, shape, dtype, method, initial)
+                    pending[future] = key
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = pending.pop(future)
+                    segment = segments[key]
+                    segment[2] -= 1
+                    if segment[2] == 0:
+                        release(segments.pop(key)[0][0])
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            wait(pending)
+            for segment in segments.values():
+                release(segment[0][0])
+
+
+def _solve_shared(index: int, supply: List[int], demand: List[int], name: str,
+                  shape: Tuple[int, ...], dtype: str, method: str, initial: str) -> BatchResult:
+    """
+    Résout une instance dans un processus de calcul, les coûts étant lus
+    directement dans la mémoire partagée.
+    """
+    shm, costs = attach(name, shape, dtype)
+    try:
+        start = time.perf_counter()
+        if method == "stepping_stone":
+            initial_solution, _ = getattr(TransportAlgorithms, initial)(supply, demand, costs)
+            solution, total_cost = TransportAlgorithms.stepping_stone(initial_solution, costs)
+        else:
+            solution, total_cost = getattr(TransportAlgorithms, method)(supply, demand, costs)
+        elapsed = time.perf_counter() - start
+        del costs
+    finally:
+        shm.close()
+    return BatchResult(index, solution, total_cost, elapsed)
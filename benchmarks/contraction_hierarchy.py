@@ -0,0 +1,53 @@
+"""
+Benchmark de la hiérarchie de contraction : temps de prétraitement et latence
+des requêtes point à point face à Dijkstra, sur une grille pondérée (graphe de
+type routier).
+
+Usage : python -m benchmarks.contraction_hierarchy [côté de la grille] [requêtes]
+"""
+import random
+import sys
+import time
+import networkx as nx
+from algorithms.contraction import ContractionHierarchy
+from algorithms.graph_algorithms import GraphAlgorithms
+
+
+def road_like_graph(side: int, seed: int = 0) -> nx.Graph:
+    rng = random.Random(seed)
+    G = nx.convert_node_labels_to_integers(nx.grid_2d_graph(side, side))
+    for u, v in G.edges():
+        G[u][v]['weight'] = rng.randint(1, 100)
+    return G
+
+
+def main(side: int, queries: int):
+    G = road_like_graph(side)
+    rng = random.Random(1)
+    pairs = [(rng.randrange(side * side), rng.randrange(side * side)) for _ in range(queries)]
+    print(f"{G.number_of_nodes()} sommets, {G.number_of_edges()} arêtes")
+
+    start = time.perf_counter()
+    index = ContractionHierarchy.build(G)
+    print(f"prétraitement : {time.perf_counter() - start:.1f} s, "
+          f"{len(index.middle)} raccourcis")
+
+    start = time.perf_counter()
+    expected = [GraphAlgorithms.dijkstra(G, s, t)[1] for s, t in pairs]
+    dijkstra = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    found = [index.query(s, t)[1] for s, t in pairs]
+    hierarchy = (time.perf_counter() - start) / queries
+
+    if found != expected:
+        raise AssertionError("Longueurs différentes de Dijkstra")
+    print(f"{'méthode':>12} {'requête (ms)':>13}")
+    print(f"{'dijkstra':>12} {dijkstra * 1e3:>13.2f}")
+    print(f"{'contraction':>12} {hierarchy * 1e3:>13.2f}")
+    print(f"accélération : {dijkstra / hierarchy:.0f}x")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [317, 100][len(args):]))
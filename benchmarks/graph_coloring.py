@@ -0,0 +1,38 @@
+"""
+Benchmark de la coloration parallèle spéculative face à Welsh-Powell séquentiel :
+temps, accélération et nombre de couleurs pour 1, 2, 4 et 8 processus.
+
+Usage : python -m benchmarks.graph_coloring [sommets arêtes]
+"""
+import sys
+import time
+import networkx as nx
+from algorithms.graph_arrays import CSRGraph
+from algorithms.graph_coloring import welsh_powell_coloring
+from algorithms.parallel_coloring import parallel_coloring
+
+WORKERS = (1, 2, 4, 8)
+
+
+def main(num_vertices: int, num_edges: int):
+    G = nx.gnm_random_graph(num_vertices, num_edges, seed=0)
+    graph = CSRGraph.from_networkx(G)
+
+    start = time.perf_counter()
+    colors = welsh_powell_coloring(graph)
+    serial = time.perf_counter() - start
+    print(f"{num_vertices} sommets, {num_edges} arêtes")
+    print(f"{'processus':>10} {'temps (s)':>10} {'accélération':>13} {'couleurs':>9}")
+    print(f"{'séquentiel':>10} {serial:>10.3f} {1.0:>13.2f} {int(colors.max()) + 1:>9}")
+
+    for workers in WORKERS:
+        start = time.perf_counter()
+        colors = parallel_coloring(graph, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"{workers:>10} {elapsed:>10.3f} {serial / elapsed:>13.2f} "
+              f"{int(colors.max()) + 1:>9}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args or [1000000, 5000000]))
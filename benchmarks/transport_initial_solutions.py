@@ -0,0 +1,42 @@
+"""
+Benchmark des méthodes de solution initiale du problème de transport :
+nombre de pivots MODI nécessaires pour atteindre l'optimum depuis chaque départ.
+
+Usage : python -m benchmarks.transport_initial_solutions [taille ...]
+"""
+import sys
+import numpy as np
+from algorithms.transport import TransportAlgorithms
+
+
+def random_instance(m: int, n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    supply = rng.integers(50, 101, m).tolist()
+    demand = rng.integers(50, 101, n).tolist()
+
+    # Équilibrer l'offre et la demande
+    difference = sum(supply) - sum(demand)
+    if difference > 0:
+        demand[-1] += difference
+    else:
+        supply[-1] -= difference
+
+    costs = rng.integers(10, 101, (m, n)).tolist()
+    return supply, demand, costs
+
+
+def main(sizes):
+    print(f"{'taille':>10} {'méthode':>14} {'coût initial':>14} {'optimum':>10} "
+          f"{'pivots':>8} {'t init (s)':>11} {'t total (s)':>12}")
+    for size in sizes:
+        supply, demand, costs = random_instance(size, size, seed=size)
+        results = TransportAlgorithms.compare_initial_solutions(supply, demand, costs)
+        label = f"{size}x{size}"
+        for method, result in results.items():
+            print(f"{label:>10} {method:>14} {result['initial_cost']:>14} "
+                  f"{result['optimal_cost']:>10} {result['pivots']:>8} "
+                  f"{result['initial_time']:>11.3f} {result['total_time']:>12.3f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [20, 50, 100, 200])
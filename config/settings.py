@@ -19,7 +19,18 @@ GRAPH_SETTINGS = {
     'EDGE_WIDTH': 2,
     'RANDOM_EDGE_PROBABILITY': 0.3,
     'MIN_WEIGHT': 1,
-    'MAX_WEIGHT': 100
+    'MAX_WEIGHT': 100,
+    # Nombre d'arbres de plus courts chemins gardés en cache par ShortestPathQuery
+    'PATH_CACHE_SIZE': 32,
+    # Nombre de scénarios tirés ensemble par PertSimulation (taille des blocs)
+    'SIMULATION_CHUNK': 1000
+}
+
+# Paramètres des problèmes de transport
+TRANSPORT_SETTINGS = {
+    # Quantité relative (à la quantité totale) en dessous de laquelle une
+    # cellule, une offre ou une demande est considérée comme nulle
+    'TOLERANCE': 1e-9
 }
 
 # Couleurs pour les algorithmes
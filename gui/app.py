@@ -113,6 +113,7 @@ class GraphApp:
             "Potentiel METRA": lambda: PotentielMetraDialog(self.root),
             "Nord-Ouest": lambda: TransportDialog(self.root, "nord_ouest"),
             "Moindre Coût": lambda: TransportDialog(self.root, "moindre_cout"),
+            "Vogel": lambda: TransportDialog(self.root, "vogel"),
             "Stepping-Stone": lambda: TransportDialog(self.root, "stepping_stone")
         }
 
@@ -1,10 +1,11 @@
 import random
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from config.settings import GUI_SETTINGS, ERROR_MESSAGES
 from utils.graph_utils import GraphVisualizer
 from algorithms.graph_algorithms import GraphAlgorithms
 from algorithms.transport import TransportAlgorithms
+from utils.transport_loader import load_transport_instance
 
 class BaseDialog:
     def __init__(self, parent, title):
@@ -325,12 +326,48 @@ class TransportDialog(BaseDialog):
         self.destinations_entry = tk.Entry(self.dialog)
         self.destinations_entry.pack(pady=5)
 
+        # Solution initiale du Stepping Stone
+        if self.method == "stepping_stone":
+            tk.Label(
+                self.dialog,
+                text="Solution initiale:",
+                bg=GUI_SETTINGS['BACKGROUND_COLOR']
+            ).pack(pady=10)
+            self.initial_method = ttk.Combobox(
+                self.dialog,
+                values=["nord_ouest", "moindre_cout", "vogel"],
+                state="readonly"
+            )
+            self.initial_method.set("vogel")
+            self.initial_method.pack(pady=5)
+
         tk.Button(
             self.dialog,
             text="Générer",
             command=self.solve_transport
         ).pack(pady=20)
 
+        tk.Button(
+            self.dialog,
+            text="Charger depuis des fichiers",
+            command=self.load_transport
+        ).pack(pady=5)
+
+    def load_transport(self):
+        try:
+            filetypes = [("Fichiers CSV ou NumPy", "*.csv *.npy"), ("Tous les fichiers", "*.*")]
+            paths = [
+                filedialog.askopenfilename(parent=self.dialog, title=title, filetypes=filetypes)
+                for title in ("Fichier de l'offre", "Fichier de la demande", "Fichier des coûts")
+            ]
+            if not all(paths):
+                return
+
+            supply, demand, costs = load_transport_instance(*paths)
+            self.display_solution(supply, demand, costs)
+        except (ValueError, OSError) as e:
+            messagebox.showerror("Erreur", str(e))
+
     def solve_transport(self):
         try:
             num_sources = int(self.sources_entry.get())
@@ -354,22 +391,28 @@ class TransportDialog(BaseDialog):
             costs = [[random.randint(10, 100) for _ in range(num_destinations)] 
                     for _ in range(num_sources)]
 
-            # Résoudre selon la méthode choisie
-            if self.method == "nord_ouest":
-                solution, total_cost = TransportAlgorithms.nord_ouest(supply, demand, costs)
-            elif self.method == "moindre_cout":
-                solution, total_cost = TransportAlgorithms.moindre_cout(supply, demand, costs)
-            else:  # stepping_stone
-                initial_solution, _ = TransportAlgorithms.nord_ouest(supply, demand, costs)
-                solution, total_cost = TransportAlgorithms.stepping_stone(initial_solution, costs)
-
-            # ✅ Définir la méthode utilisée
-            method_name = self.method
-
-            # ✅ Appel de la visualisation avec method_name
-            visualizer = GraphVisualizer()
-            visualizer.display_transport_solution(supply, demand, costs, solution, total_cost, method_name)
-            self.dialog.destroy()
+            self.display_solution(supply, demand, costs)
         #hhhh
         except ValueError as e:
-            messagebox.showerror("Erreur", str(e))
\ No newline at end of file
+            messagebox.showerror("Erreur", str(e))
+
+    def display_solution(self, supply, demand, costs):
+        # Résoudre selon la méthode choisie
+        if self.method == "nord_ouest":
+            solution, total_cost = TransportAlgorithms.nord_ouest(supply, demand, costs)
+        elif self.method == "moindre_cout":
+            solution, total_cost = TransportAlgorithms.moindre_cout(supply, demand, costs)
+        elif self.method == "vogel":
+            solution, total_cost = TransportAlgorithms.vogel(supply, demand, costs)
+        else:  # stepping_stone
+            initial = getattr(TransportAlgorithms, self.initial_method.get())
+            initial_solution, _ = initial(supply, demand, costs)
+            solution, total_cost = TransportAlgorithms.stepping_stone(initial_solution, costs)
+
+        # ✅ Définir la méthode utilisée
+        method_name = self.method
+
+        # ✅ Appel de la visualisation avec method_name
+        visualizer = GraphVisualizer()
+        visualizer.display_transport_solution(supply, demand, costs, solution, total_cost, method_name)
+        self.dialog.destroy()
\ No newline at end of file
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+from algorithms.transport import TransportAlgorithms
+
+# Offre réelle, demande entière : les quantités ne doivent pas être tronquées
+SUPPLY = [5.5, 4.5]
+DEMAND = [5, 5]
+COSTS = [[1, 2], [3, 4]]
+
+
+@pytest.mark.parametrize("method", [TransportAlgorithms.nord_ouest,
+                                    TransportAlgorithms.moindre_cout,
+                                    TransportAlgorithms.vogel])
+def test_offre_et_demande_de_types_differents(method):
+    for supply, demand in ((SUPPLY, DEMAND), (DEMAND[::-1], SUPPLY[::-1])):
+        allocation, _ = method(supply, demand, COSTS)
+        np.testing.assert_allclose(np.sum(allocation, axis=1), supply)
+        np.testing.assert_allclose(np.sum(allocation, axis=0), demand)
+
+        optimum, _ = TransportAlgorithms.stepping_stone(allocation, COSTS)
+        np.testing.assert_allclose(np.sum(optimum, axis=1), supply)
+        np.testing.assert_allclose(np.sum(optimum, axis=0), demand)
@@ -184,11 +184,12 @@ class GraphVisualizer:
         Affiche la solution du problème de transport avec le nom de la méthode utilisée.
         
         Args:
-            method_name: str - 'nord_ouest', 'moindre_cout', ou 'stepping_stone'
+            method_name: str - 'nord_ouest', 'moindre_cout', 'vogel' ou 'stepping_stone'
         """
         method_titles = {
             'nord_ouest': 'Méthode du Nord-Ouest',
             'moindre_cout': 'Méthode du Moindre Coût',
+            'vogel': 'Méthode de Vogel',
             'stepping_stone': 'Méthode du Stepping Stone'
         }
         
@@ -246,6 +247,7 @@ class GraphVisualizer:
         method_info = {
             'nord_ouest': "Allocation séquentielle depuis le coin nord-ouest",
             'moindre_cout': "Allocation prioritaire aux coûts minimaux",
+            'vogel': "Allocation guidée par les pénalités de Vogel",
             'stepping_stone': "Solution optimisée par la méthode du Stepping Stone"
         }
         
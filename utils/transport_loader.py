@@ -0,0 +1,88 @@
+import os
+from itertools import islice
+import numpy as np
+from typing import Tuple
+
+
+def load_vector(path: str, delimiter: str = ',') -> np.ndarray:
+    """
+    Charge un vecteur d'offre ou de demande depuis un fichier .npy (projeté en
+    mémoire) ou CSV (une valeur par ligne ou une seule ligne).
+    """
+    if path.endswith('.npy'):
+        vector = np.load(path, mmap_mode='r')
+    else:
+        vector = np.loadtxt(path, delimiter=delimiter, ndmin=1)
+    if vector.ndim != 1:
+        vector = vector.reshape(-1)
+    return vector
+
+
+def load_cost_matrix(path: str, delimiter: str = ',', dtype=np.float64,
+                     chunk_rows: int = 4096) -> np.ndarray:
+    """
+    Charge une matrice de coûts projetée en mémoire (np.memmap), sans la copier
+    en RAM.
+
+    Un fichier .npy est projeté directement. Un fichier CSV est converti une
+    seule fois, par blocs de chunk_rows lignes, en un cache .npy placé à côté
+    (fichier.csv.npy) ; les chargements suivants projettent ce cache tant qu'il
+    est plus récent que le CSV.
+    """
+    if path.endswith('.npy'):
+        return np.load(path, mmap_mode='r')
+
+    cache = path + '.npy'
+    if not os.path.exists(cache) or os.path.getmtime(cache) < os.path.getmtime(path):
+        _convert_csv(path, cache, delimiter, dtype, chunk_rows)
+    return np.load(cache, mmap_mode='r')
+
+
+def load_transport_instance(supply_path: str, demand_path: str, costs_path: str,
+                            delimiter: str = ',') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Charge une instance de transport (offre, demande, coûts) depuis des
+    fichiers CSV ou .npy.
+    """
+    supply = load_vector(supply_path, delimiter)
+    demand = load_vector(demand_path, delimiter)
+    costs = load_cost_matrix(costs_path, delimiter)
+    if costs.shape != (len(supply), len(demand)):
+        raise ValueError("La matrice des coûts doit avoir une ligne par source "
+                         "et une colonne par destination")
+    return supply, demand, costs
+
+
+def _convert_csv(path: str, cache: str, delimiter: str, dtype, chunk_rows: int) -> None:
+    """
+    Convertit un CSV en .npy par blocs de lignes : seule la taille d'un bloc
+    est présente en mémoire à un instant donné.
+    """
+    # Premier passage : dimensions de la matrice
+    with open(path) as source:
+        first = source.readline()
+        if not first.strip():
+            raise ValueError(f"Fichier de coûts vide: {path}")
+        columns = len(first.split(delimiter))
+        rows = 1 + sum(1 for line in source if line.strip())
+
+    temporary = cache + '.tmp'
+    matrix = np.lib.format.open_memmap(temporary, mode='w+', dtype=dtype, shape=(rows, columns))
+    try:
+        with open(path) as source:
+            lines = (line for line in source if line.strip())
+            start = 0
+            while start < rows:
+                block = np.loadtxt(islice(lines, chunk_rows), delimiter=delimiter,
+                                   dtype=dtype, ndmin=2)
+                if block.shape[1] != columns:
+                    raise ValueError(f"Nombre de colonnes incohérent dans {path}")
+                matrix[start:start + len(block)] = block
+                start += len(block)
+        matrix.flush()
+        del matrix
+    except Exception:
+        del matrix
+        os.remove(temporary)
+        raise
+    os.replace(temporary, cache)